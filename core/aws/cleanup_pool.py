@@ -0,0 +1,30 @@
+"""Shared worker pool for background placement group and EIP cleanup."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from ..constants import CLEANUP_MAX_WORKERS
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_cleanup_pool() -> ThreadPoolExecutor:
+    """Get the process-wide cleanup pool, creating it on first use.
+    
+    Placement group and EIP cleanups share one bounded pool, so the number
+    of cleanup threads stays at CLEANUP_MAX_WORKERS however many failed
+    candidates are pending; further tasks queue. Workers are not daemon
+    threads, so pending cleanups still finish if the program exits normally.
+    
+    Returns:
+        Shared ThreadPoolExecutor
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(
+                max_workers=CLEANUP_MAX_WORKERS, thread_name_prefix="cleanup"
+            )
+        return _pool
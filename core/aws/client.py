@@ -0,0 +1,35 @@
+"""Shared boto3 client construction for the latency finder."""
+
+import boto3
+from botocore.config import Config as BotoConfig
+
+from ..constants import (
+    AWS_MAX_ATTEMPTS, AWS_RETRY_MODE, AWS_MAX_POOL_CONNECTIONS,
+    AWS_CONNECT_TIMEOUT, AWS_READ_TIMEOUT
+)
+
+
+def create_ec2_client(region: str):
+    """Create an EC2 client with client-side retries.
+    
+    Throttling and transient API errors are retried by botocore with jittered
+    exponential backoff instead of hand-rolled sleep loops. Clients are
+    thread-safe, so each manager's client is also used by its background
+    cleanup threads; the connection pool is sized for that. TCP keepalive
+    keeps pooled HTTPS connections alive between the main loop's sparse
+    calls so they do not pay a fresh TLS handshake.
+    
+    Args:
+        region: AWS region name
+        
+    Returns:
+        boto3 EC2 client
+    """
+    boto_config = BotoConfig(
+        retries={'max_attempts': AWS_MAX_ATTEMPTS, 'mode': AWS_RETRY_MODE},
+        max_pool_connections=AWS_MAX_POOL_CONNECTIONS,
+        tcp_keepalive=True,
+        connect_timeout=AWS_CONNECT_TIMEOUT,
+        read_timeout=AWS_READ_TIMEOUT
+    )
+    return boto3.client('ec2', region_name=region, config=boto_config)
@@ -1,10 +1,16 @@
 """EC2 instance management for the latency finder."""
 
-from typing import Dict, Optional, Tuple, Any
-import boto3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple, Any
 from botocore.exceptions import ClientError
 
 from ..config import Config
+from ..constants import (
+    TERMINATE_BATCH_SIZE, TERMINATE_BATCH_MAX_DELAY, WAIT_RUNNING_TIMEOUT,
+    WAIT_RUNNING_INITIAL_DELAY, WAIT_RUNNING_BACKOFF, WAIT_RUNNING_MAX_DELAY
+)
+from .client import create_ec2_client
 
 
 class EC2Manager:
@@ -17,7 +23,12 @@ class EC2Manager:
             config: Configuration object
         """
         self.config = config
-        self.client = boto3.client('ec2', region_name=config.region)
+        self.client = create_ec2_client(config.region)
+        
+        # Instances queued by queue_termination(), flushed in batches
+        self._pending_terminations: List[str] = []
+        self._termination_lock = threading.Lock()
+        self._termination_timer: Optional[threading.Timer] = None
     
     def launch_instance(self, instance_type: str, placement_group: str, 
                        instance_name: str) -> Tuple[Optional[str], Optional[str]]:
@@ -80,26 +91,48 @@ class EC2Manager:
         except ClientError as e:
             return None, str(e)
     
-    def wait_for_running(self, instance_id: str, max_attempts: int = 30) -> bool:
+    def wait_for_running(self, instance_id: str,
+                         timeout: float = WAIT_RUNNING_TIMEOUT) -> Tuple[bool, Optional[str]]:
         """Wait for instance to reach running state.
         
+        Polls DescribeInstances with a delay growing from WAIT_RUNNING_INITIAL_DELAY
+        by WAIT_RUNNING_BACKOFF up to WAIT_RUNNING_MAX_DELAY. The response that
+        reports "running" also carries the instance's public IP, so callers
+        need no separate lookup.
+        
         Args:
             instance_id: EC2 instance ID
-            max_attempts: Maximum wait attempts
+            timeout: Maximum seconds to wait
             
         Returns:
-            True if instance is running, False on timeout
+            Tuple of (is_running, public_ip); public_ip is None if not yet assigned
         """
-        try:
-            waiter = self.client.get_waiter('instance_running')
-            waiter.wait(
-                InstanceIds=[instance_id],
-                WaiterConfig={"Delay": 5, "MaxAttempts": max_attempts}
-            )
-            return True
-        except Exception as e:
-            print(f"[WARN] Wait for running failed: {e}")
-            return False
+        deadline = time.monotonic() + timeout
+        delay = WAIT_RUNNING_INITIAL_DELAY
+        
+        while True:
+            try:
+                response = self.client.describe_instances(InstanceIds=[instance_id])
+                for reservation in response['Reservations']:
+                    for instance in reservation['Instances']:
+                        state = instance['State']['Name']
+                        if state == 'running':
+                            return True, self._extract_public_ip(instance)
+                        if state != 'pending':
+                            print(f"[WARN] Instance entered state '{state}' while waiting for running")
+                            return False, None
+            except ClientError as e:
+                # A just-launched instance can briefly be unknown to DescribeInstances
+                if 'InvalidInstanceID.NotFound' not in str(e):
+                    print(f"[WARN] Wait for running failed: {e}")
+                    return False, None
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                print(f"[WARN] Instance not running after {int(timeout)}s")
+                return False, None
+            time.sleep(min(delay, remaining))
+            delay = min(delay * WAIT_RUNNING_BACKOFF, WAIT_RUNNING_MAX_DELAY)
     
     def terminate_instance(self, instance_id: str) -> bool:
         """Terminate an EC2 instance.
@@ -117,6 +150,57 @@ class EC2Manager:
             print(f"[ERROR] Terminating {instance_id} failed: {e}")
             return False
     
+    def queue_termination(self, instance_id: str) -> None:
+        """Queue an instance for batched termination.
+        
+        The queue is flushed with a single TerminateInstances call once it
+        holds TERMINATE_BATCH_SIZE instances, or TERMINATE_BATCH_MAX_DELAY
+        seconds after the first instance was queued. Call
+        flush_terminations() to terminate everything queued right away.
+        
+        Args:
+            instance_id: EC2 instance ID
+        """
+        with self._termination_lock:
+            self._pending_terminations.append(instance_id)
+            flush_now = len(self._pending_terminations) >= TERMINATE_BATCH_SIZE
+            if not flush_now and self._termination_timer is None:
+                self._termination_timer = threading.Timer(
+                    TERMINATE_BATCH_MAX_DELAY, self.flush_terminations
+                )
+                self._termination_timer.daemon = True
+                self._termination_timer.start()
+        
+        if flush_now:
+            self.flush_terminations()
+    
+    def flush_terminations(self) -> None:
+        """Terminate all queued instances with one API call.
+        
+        If the batch call fails (e.g. one ID is already gone), each instance
+        is retried individually so the rest are still terminated.
+        """
+        with self._termination_lock:
+            instance_ids = self._pending_terminations
+            self._pending_terminations = []
+            if self._termination_timer is not None:
+                self._termination_timer.cancel()
+                self._termination_timer = None
+        
+        if not instance_ids:
+            return
+        
+        try:
+            self.client.terminate_instances(InstanceIds=instance_ids)
+            print(f"[OK] Termination initiated for {len(instance_ids)} instance(s): {', '.join(instance_ids)}")
+        except Exception as e:
+            if len(instance_ids) == 1:
+                print(f"[ERROR] Terminating {instance_ids[0]} failed: {e}")
+                return
+            print(f"[WARN] Batch termination failed ({e}), terminating individually...")
+            for instance_id in instance_ids:
+                self.terminate_instance(instance_id)
+    
     def describe_instances(self, instance_ids: list) -> Dict[str, Dict[str, Any]]:
         """Get instance information.
         
@@ -135,6 +219,7 @@ class EC2Manager:
                         'state': instance['State']['Name'],
                         'placement_group': instance.get('Placement', {}).get('GroupName'),
                         'instance_type': instance.get('InstanceType'),
+                        'public_ip': self._extract_public_ip(instance),
                         'tags': {tag['Key']: tag['Value'] for tag in instance.get('Tags', [])}
                     }
         except Exception as e:
@@ -157,26 +242,36 @@ class EC2Manager:
                 return None
             
             instance = response['Reservations'][0]['Instances'][0]
-            
-            # Check for public IP
-            public_ip = instance.get('PublicIpAddress')
-            if public_ip:
-                return public_ip
-            
-            # Check for associated EIP via network interface
-            network_interfaces = instance.get('NetworkInterfaces', [])
-            if network_interfaces:
-                association = network_interfaces[0].get('Association', {})
-                public_ip = association.get('PublicIp')
-                if public_ip:
-                    return public_ip
-            
-            return None
+            return self._extract_public_ip(instance)
             
         except Exception as e:
             print(f"[ERROR] Failed to get instance public IP: {e}")
             return None
     
+    def _extract_public_ip(self, instance: Dict[str, Any]) -> Optional[str]:
+        """Get the public IP from a DescribeInstances instance record.
+        
+        Args:
+            instance: Instance dict from a DescribeInstances response
+            
+        Returns:
+            Public IP address or None if not assigned
+        """
+        # Check for public IP
+        public_ip = instance.get('PublicIpAddress')
+        if public_ip:
+            return public_ip
+        
+        # Check for associated EIP via network interface
+        network_interfaces = instance.get('NetworkInterfaces', [])
+        if network_interfaces:
+            association = network_interfaces[0].get('Association', {})
+            public_ip = association.get('PublicIp')
+            if public_ip:
+                return public_ip
+        
+        return None
+    
     def is_capacity_error(self, error_message: str) -> bool:
         """Check if error is a capacity issue.
         
@@ -2,11 +2,14 @@
 
 import time
 import threading
-from typing import List, Optional, Tuple
-import boto3
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Dict, List, Optional, Tuple
 from botocore.exceptions import ClientError
 
 from ..config import Config
+from .client import create_ec2_client
+from .cleanup_pool import get_cleanup_pool
+from .termination_watcher import get_termination_watcher
 from ..constants import CLEANUP_CHECK_DELAY, CLEANUP_MAX_ATTEMPTS, CLEANUP_FINAL_DELAY
 
 
@@ -20,8 +23,14 @@ class EIPManager:
             config: Configuration object
         """
         self.config = config
-        self.client = boto3.client('ec2', region_name=config.region)
-        self.cleanup_threads: List[threading.Thread] = []
+        self.client = create_ec2_client(config.region)
+        self._watcher = get_termination_watcher(config.region)
+        # Bounded pool shared with the other manager's background cleanups
+        self._cleanup_pool = get_cleanup_pool()
+        self.cleanup_futures: List[Future] = []
+        self._cleanup_lock = threading.Lock()
+        # An allocation's public IP never changes, so it is looked up at most once
+        self._public_ips: Dict[str, str] = {}
     
     def allocate_eip(self, name: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """Allocate a new Elastic IP address.
@@ -43,6 +52,7 @@ class EIPManager:
             
             allocation_id = response['AllocationId']
             public_ip = response['PublicIp']
+            self._public_ips[allocation_id] = public_ip
             print(f"  [OK] Allocated EIP {public_ip}")
             return allocation_id, public_ip, None
             
@@ -70,6 +80,9 @@ class EIPManager:
             return True
             
         except ClientError as e:
+            if e.response.get('Error', {}).get('Code') == 'InvalidAllocationID.NotFound':
+                # Allocation is gone, so its cached public IP is stale
+                self._public_ips.pop(allocation_id, None)
             print(f"[ERROR] Failed to associate EIP: {e}")
             return False
     
@@ -95,6 +108,7 @@ class EIPManager:
             
             # Release the EIP
             self.client.release_address(AllocationId=allocation_id)
+            self._public_ips.pop(allocation_id, None)
             print(f"  [OK] Released EIP")
             return True
             
@@ -105,23 +119,33 @@ class EIPManager:
     def get_eip_public_ip(self, allocation_id: str) -> Optional[str]:
         """Get the public IP address from an EIP allocation ID.
         
+        The address is fixed for the lifetime of the allocation, so it is
+        served from the cache filled by allocate_eip() when possible and only
+        looked up with describe_addresses otherwise.
+        
         Args:
             allocation_id: EIP allocation ID
             
         Returns:
             Public IP address or None if not found
         """
+        public_ip = self._public_ips.get(allocation_id)
+        if public_ip:
+            return public_ip
+        
         try:
             response = self.client.describe_addresses(AllocationIds=[allocation_id])
             if response['Addresses']:
-                return response['Addresses'][0]['PublicIp']
+                public_ip = response['Addresses'][0]['PublicIp']
+                self._public_ips[allocation_id] = public_ip
+                return public_ip
             return None
             
         except ClientError as e:
             print(f"[WARN] Could not get EIP public IP: {e}")
             return None
     
-    def schedule_async_eip_cleanup(self, instance_id: str, allocation_id: str, eip_name: str) -> threading.Thread:
+    def schedule_async_eip_cleanup(self, instance_id: str, allocation_id: str, eip_name: str) -> Future:
         """Schedule asynchronous cleanup of EIP after instance termination.
         
         Args:
@@ -130,84 +154,75 @@ class EIPManager:
             eip_name: EIP name for logging
             
         Returns:
-            The cleanup thread
+            Future for the cleanup task
         """
         def cleanup():
             print(f"[Background] Scheduled EIP cleanup for {eip_name} "
-                  f"(checking every 10 seconds for up to 30 minutes)")
+                  f"(checking every 10-60 seconds for up to 30 minutes)")
             
-            # Create a new EC2 client for this thread
-            thread_client = boto3.client('ec2', region_name=self.config.region)
+            # Wait for instance to fully terminate (polled by the shared watcher)
+            if not self._watcher.wait_for_termination(
+                    instance_id, CLEANUP_CHECK_DELAY * CLEANUP_MAX_ATTEMPTS):
+                print(f"[Background] [WARN] Timeout: Instance {instance_id} "
+                      f"still terminating after 30 minutes (EIP {eip_name} not released)")
+                return
             
             try:
-                # Wait for instance to fully terminate
-                waiter = thread_client.get_waiter('instance_terminated')
-                waiter.wait(
-                    InstanceIds=[instance_id],
-                    WaiterConfig={
-                        'Delay': CLEANUP_CHECK_DELAY,
-                        'MaxAttempts': CLEANUP_MAX_ATTEMPTS
-                    }
-                )
-                
                 # Small delay to ensure AWS has fully updated its state
                 time.sleep(CLEANUP_FINAL_DELAY)
                 
                 # Now release the EIP
                 try:
                     # Check if EIP is associated and disassociate if needed
-                    response = thread_client.describe_addresses(AllocationIds=[allocation_id])
+                    response = self.client.describe_addresses(AllocationIds=[allocation_id])
                     if response['Addresses']:
                         eip_info = response['Addresses'][0]
                         association_id = eip_info.get('AssociationId')
                         if association_id:
-                            thread_client.disassociate_address(AssociationId=association_id)
+                            self.client.disassociate_address(AssociationId=association_id)
                             time.sleep(2)
                     
                     # Release the EIP
-                    thread_client.release_address(AllocationId=allocation_id)
+                    self.client.release_address(AllocationId=allocation_id)
+                    self._public_ips.pop(allocation_id, None)
                     print(f"[Background] [OK] Successfully released EIP {eip_name}")
                     
                 except Exception as eip_error:
                     print(f"[Background] [WARN] Failed to release EIP {eip_name}: {eip_error}")
                 
             except Exception as e:
-                if 'Max attempts exceeded' in str(e):
-                    print(f"[Background] [WARN] Timeout: Instance {instance_id} "
-                          f"still terminating after 30 minutes (EIP {eip_name} not released)")
-                else:
-                    print(f"[Background] [WARN] Failed to cleanup EIP {eip_name}: {e}")
+                print(f"[Background] [WARN] Failed to cleanup EIP {eip_name}: {e}")
         
-        # Start cleanup in a background thread (not daemon so we can wait on Ctrl+C)
-        thread = threading.Thread(target=cleanup, daemon=False)
-        thread.start()
-        self.cleanup_threads.append(thread)
-        return thread
+        future = self._cleanup_pool.submit(cleanup)
+        with self._cleanup_lock:
+            # Drop finished tasks so the list stays bounded over a long search
+            self.cleanup_futures = [f for f in self.cleanup_futures if not f.done()]
+            self.cleanup_futures.append(future)
+        return future
     
     def wait_for_cleanup_threads(self) -> None:
         """Wait for all EIP cleanup threads to complete."""
-        active_threads = [t for t in self.cleanup_threads if t.is_alive()]
+        active_threads = [f for f in self.cleanup_futures if not f.done()]
         if not active_threads:
             return
         
         print(f"\n[WAIT] Waiting for {len(active_threads)} EIP cleanup task(s) to complete...")
         print("   This ensures all EIPs are released properly.")
-        print("   (Checking every 10 seconds, up to 30 minutes per task)")
+        print("   (Checking every 10-60 seconds, up to 30 minutes per task)")
         
-        start_wait = time.time()
-        last_count = len(active_threads)
+        start_wait = time.monotonic()
         
         while active_threads:
-            # Show progress every 10 seconds to match cleanup check interval
-            time.sleep(10)
-            active_threads = [t for t in self.cleanup_threads if t.is_alive()]
+            # Wake as soon as a task finishes, or every 10 seconds for progress
+            done, _ = wait(active_threads, timeout=10, return_when=FIRST_COMPLETED)
+            if done:
+                print(f"   [OK] {len(done)} EIP cleanup task(s) completed")
             
-            if len(active_threads) < last_count:
-                print(f"   [OK] {last_count - len(active_threads)} EIP cleanup task(s) completed")
-                last_count = len(active_threads)
+            # Re-read the list: tasks submitted while waiting are included too
+            active_threads = [f for f in self.cleanup_futures if not f.done()]
             
-            if active_threads:
-                elapsed = int(time.time() - start_wait)
+            if active_threads and not done:
+                elapsed = int(time.monotonic() - start_wait)
                 mins = elapsed // 60
                 secs = elapsed % 60
                 print(f"   [WAIT] {len(active_threads)} EIP cleanup task(s) still running... "
@@ -217,7 +232,7 @@ class EIPManager:
     
     def get_active_cleanup_count(self) -> int:
         """Get count of active EIP cleanup threads."""
-        return sum(1 for t in self.cleanup_threads if t.is_alive())
+        return sum(1 for f in self.cleanup_futures if not f.done())
     
     def generate_eip_name(self, timestamp: int) -> str:
         """Generate EIP name with timestamp.
@@ -2,10 +2,13 @@
 
 import time
 import threading
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from typing import List
-import boto3
 
 from ..config import Config
+from .client import create_ec2_client
+from .cleanup_pool import get_cleanup_pool
+from .termination_watcher import get_termination_watcher
 from ..constants import CLEANUP_CHECK_DELAY, CLEANUP_MAX_ATTEMPTS, CLEANUP_FINAL_DELAY
 
 
@@ -19,8 +22,12 @@ class PlacementGroupManager:
             config: Configuration object
         """
         self.config = config
-        self.client = boto3.client('ec2', region_name=config.region)
-        self.cleanup_threads: List[threading.Thread] = []
+        self.client = create_ec2_client(config.region)
+        self._watcher = get_termination_watcher(config.region)
+        # Bounded pool shared with the other manager's background cleanups
+        self._cleanup_pool = get_cleanup_pool()
+        self.cleanup_futures: List[Future] = []
+        self._cleanup_lock = threading.Lock()
     
     def create_placement_group(self, name: str) -> bool:
         """Create a cluster placement group.
@@ -60,7 +67,7 @@ class PlacementGroupManager:
             print(f"  [WARN] Could not delete placement group: {e}")
             return False
     
-    def schedule_async_cleanup(self, instance_id: str, placement_group_name: str) -> threading.Thread:
+    def schedule_async_cleanup(self, instance_id: str, placement_group_name: str) -> Future:
         """Schedule asynchronous cleanup of placement group after instance termination.
         
         Args:
@@ -68,71 +75,61 @@ class PlacementGroupManager:
             placement_group_name: Placement group name
             
         Returns:
-            The cleanup thread
+            Future for the cleanup task
         """
         def cleanup():
             print(f"[Background] Scheduled cleanup for PG {placement_group_name} "
-                  f"(checking every 10 seconds for up to 30 minutes)")
+                  f"(checking every 10-60 seconds for up to 30 minutes)")
             
-            # Create a new EC2 client for this thread
-            thread_client = boto3.client('ec2', region_name=self.config.region)
+            # Wait for instance to fully terminate (polled by the shared watcher)
+            if not self._watcher.wait_for_termination(
+                    instance_id, CLEANUP_CHECK_DELAY * CLEANUP_MAX_ATTEMPTS):
+                print(f"[Background] [WARN] Timeout: Instance {instance_id} "
+                      f"still terminating after 30 minutes")
+                return
             
             try:
-                # Wait for instance to fully terminate
-                waiter = thread_client.get_waiter('instance_terminated')
-                waiter.wait(
-                    InstanceIds=[instance_id],
-                    WaiterConfig={
-                        'Delay': CLEANUP_CHECK_DELAY,
-                        'MaxAttempts': CLEANUP_MAX_ATTEMPTS
-                    }
-                )
-                
                 # Small delay to ensure AWS has fully updated its state
                 time.sleep(CLEANUP_FINAL_DELAY)
                 
                 # Now delete the placement group
-                thread_client.delete_placement_group(GroupName=placement_group_name)
+                self.client.delete_placement_group(GroupName=placement_group_name)
                 print(f"[Background] [OK] Successfully deleted placement group {placement_group_name}")
                 
             except Exception as e:
-                if 'Max attempts exceeded' in str(e):
-                    print(f"[Background] [WARN] Timeout: Instance {instance_id} "
-                          f"still terminating after 30 minutes")
-                else:
-                    print(f"[Background] [WARN] Failed to delete placement group "
-                          f"{placement_group_name}: {e}")
+                print(f"[Background] [WARN] Failed to delete placement group "
+                      f"{placement_group_name}: {e}")
         
-        # Start cleanup in a background thread (not daemon so we can wait on Ctrl+C)
-        thread = threading.Thread(target=cleanup, daemon=False)
-        thread.start()
-        self.cleanup_threads.append(thread)
-        return thread
+        future = self._cleanup_pool.submit(cleanup)
+        with self._cleanup_lock:
+            # Drop finished tasks so the list stays bounded over a long search
+            self.cleanup_futures = [f for f in self.cleanup_futures if not f.done()]
+            self.cleanup_futures.append(future)
+        return future
     
     def wait_for_cleanup_threads(self) -> None:
         """Wait for all cleanup threads to complete."""
-        active_threads = [t for t in self.cleanup_threads if t.is_alive()]
+        active_threads = [f for f in self.cleanup_futures if not f.done()]
         if not active_threads:
             return
         
         print(f"\n[WAIT] Waiting for {len(active_threads)} background cleanup task(s) to complete...")
         print("   This ensures all instances are terminated and placement groups are deleted.")
-        print("   (Checking every 10 seconds, up to 30 minutes per task)")
+        print("   (Checking every 10-60 seconds, up to 30 minutes per task)")
         
-        start_wait = time.time()
-        last_count = len(active_threads)
+        start_wait = time.monotonic()
         
         while active_threads:
-            # Show progress every 10 seconds to match cleanup check interval
-            time.sleep(10)
-            active_threads = [t for t in self.cleanup_threads if t.is_alive()]
+            # Wake as soon as a task finishes, or every 10 seconds for progress
+            done, _ = wait(active_threads, timeout=10, return_when=FIRST_COMPLETED)
+            if done:
+                print(f"   [OK] {len(done)} task(s) completed")
             
-            if len(active_threads) < last_count:
-                print(f"   [OK] {last_count - len(active_threads)} task(s) completed")
-                last_count = len(active_threads)
+            # Re-read the list: tasks submitted while waiting are included too
+            active_threads = [f for f in self.cleanup_futures if not f.done()]
             
-            if active_threads:
-                elapsed = int(time.time() - start_wait)
+            if active_threads and not done:
+                elapsed = int(time.monotonic() - start_wait)
                 mins = elapsed // 60
                 secs = elapsed % 60
                 print(f"   [WAIT] {len(active_threads)} task(s) still running... "
@@ -142,7 +139,7 @@ class PlacementGroupManager:
     
     def get_active_cleanup_count(self) -> int:
         """Get count of active cleanup threads."""
-        return sum(1 for t in self.cleanup_threads if t.is_alive())
+        return sum(1 for f in self.cleanup_futures if not f.done())
     
     def generate_placement_group_name(self, timestamp: int) -> str:
         """Generate placement group name with timestamp.
@@ -0,0 +1,155 @@
+"""Shared instance termination polling for background cleanup tasks."""
+
+import threading
+from typing import Dict, List, Set
+
+from .client import create_ec2_client
+from ..constants import CLEANUP_CHECK_DELAY, CLEANUP_MAX_CHECK_DELAY
+
+# EC2 accepts at most 200 values per describe filter
+DESCRIBE_FILTER_MAX_VALUES = 200
+
+
+class TerminationWatcher:
+    """Waits for instances to terminate using one poller for all of them.
+    
+    Every cleanup task used to run its own instance_terminated waiter, i.e.
+    one DescribeInstances call per task every CLEANUP_CHECK_DELAY seconds.
+    Here a single background thread describes all watched instances in one
+    call per interval and wakes the tasks whose instance has terminated.
+    
+    The interval starts at CLEANUP_CHECK_DELAY and doubles up to
+    CLEANUP_MAX_CHECK_DELAY while the watched set is unchanged; it resets
+    whenever an instance terminates or a new one is watched.
+    """
+    
+    def __init__(self, region: str):
+        """Initialize termination watcher.
+        
+        Args:
+            region: AWS region name
+        """
+        self.client = create_ec2_client(region)
+        self._lock = threading.Lock()
+        # instance_id -> [event set on termination, number of waiting tasks]
+        self._watched: Dict[str, list] = {}
+        self._thread = None
+        # Set when a new instance is watched so the poller stops backing off
+        self._changed = threading.Event()
+    
+    def wait_for_termination(self, instance_id: str, timeout: float) -> bool:
+        """Block until an instance reaches the terminated state.
+        
+        Args:
+            instance_id: EC2 instance ID
+            timeout: Maximum seconds to wait
+        
+        Returns:
+            True if the instance terminated, False on timeout
+        """
+        with self._lock:
+            entry = self._watched.get(instance_id)
+            if entry is None:
+                entry = self._watched[instance_id] = [threading.Event(), 0]
+                self._changed.set()
+            entry[1] += 1
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._poll, daemon=True, name="termination-watcher"
+                )
+                self._thread.start()
+        
+        if entry[0].wait(timeout):
+            return True
+        
+        with self._lock:
+            entry[1] -= 1
+            if entry[1] == 0 and self._watched.get(instance_id) is entry:
+                del self._watched[instance_id]
+            # The poller sets the event under this lock, so this also catches
+            # a termination reported just as the wait timed out
+            return entry[0].is_set()
+    
+    def _poll(self) -> None:
+        """Poll watched instances until none are left."""
+        delay = CLEANUP_CHECK_DELAY
+        previous_ids = set()
+        
+        while True:
+            self._changed.clear()
+            with self._lock:
+                instance_ids = list(self._watched)
+                if not instance_ids:
+                    # Exit under the lock so a new waiter starts a fresh poller
+                    self._thread = None
+                    return
+            
+            # Newly watched instances restart the backoff
+            if not previous_ids.issuperset(instance_ids):
+                delay = CLEANUP_CHECK_DELAY
+            
+            terminated = self._get_terminated(instance_ids)
+            
+            with self._lock:
+                for instance_id in terminated:
+                    entry = self._watched.pop(instance_id, None)
+                    if entry:
+                        entry[0].set()
+            
+            previous_ids = set(instance_ids) - terminated
+            # Wakes early when a new instance is watched; the check above
+            # then resets the backoff and polls it right away
+            self._changed.wait(delay)
+            delay = CLEANUP_CHECK_DELAY if terminated else min(delay * 2, CLEANUP_MAX_CHECK_DELAY)
+    
+    def _get_terminated(self, instance_ids: List[str]) -> Set[str]:
+        """Find which of the given instances are terminated.
+        
+        Uses an instance-id filter rather than InstanceIds so that an ID
+        not yet visible to DescribeInstances does not fail the whole call.
+        
+        Args:
+            instance_ids: EC2 instance IDs
+        
+        Returns:
+            Set of terminated instance IDs
+        """
+        terminated = set()
+        paginator = self.client.get_paginator('describe_instances')
+        for start in range(0, len(instance_ids), DESCRIBE_FILTER_MAX_VALUES):
+            chunk = instance_ids[start:start + DESCRIBE_FILTER_MAX_VALUES]
+            try:
+                pages = paginator.paginate(Filters=[
+                    {'Name': 'instance-id', 'Values': chunk},
+                    {'Name': 'instance-state-name', 'Values': ['terminated']}
+                ])
+                for page in pages:
+                    for reservation in page['Reservations']:
+                        for instance in reservation['Instances']:
+                            terminated.add(instance['InstanceId'])
+            except Exception as e:
+                print(f"[Background] [WARN] Could not check instance states: {e}")
+        return terminated
+
+
+_watchers: Dict[str, TerminationWatcher] = {}
+_watchers_lock = threading.Lock()
+
+
+def get_termination_watcher(region: str) -> TerminationWatcher:
+    """Get the process-wide termination watcher for a region.
+    
+    Placement group and EIP cleanups for the same instance share it, so
+    each interval costs one DescribeInstances call in total.
+    
+    Args:
+        region: AWS region name
+    
+    Returns:
+        TerminationWatcher instance
+    """
+    with _watchers_lock:
+        watcher = _watchers.get(region)
+        if watcher is None:
+            watcher = _watchers[region] = TerminationWatcher(region)
+        return watcher
@@ -151,4 +151,9 @@ class Config:
     @property
     def use_eip(self) -> bool:
         """Whether to use Elastic IPs (True) or auto-assigned IPs (False)."""
-        return self._data['use_eip']
\ No newline at end of file
+        return self._data['use_eip']
+    
+    @property
+    def concurrent_instances(self) -> int:
+        """Number of candidate instances to test in parallel (optional, default 1)."""
+        return max(1, int(self._data.get('concurrent_instances', 1)))
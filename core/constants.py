@@ -16,7 +16,7 @@ echo "[$(date)] Latency finder instance started" >> $LOG_FILE
 
 # Install basic required packages
 echo "[$(date)] Installing required packages..." >> $LOG_FILE
-yum install -y -q bind-utils python3 2>&1 | tee -a $LOG_FILE
+yum install -y -q python3 rsync 2>&1 | tee -a $LOG_FILE
 
 # Log instance information
 echo "[$(date)] Instance information:" >> $LOG_FILE
@@ -30,17 +30,50 @@ echo "[$(date)] Latency finder initialization completed" >> $LOG_FILE
 # Default values
 DEFAULT_SSH_TIMEOUT = 300  # Default for general SSH commands
 DEFAULT_SSH_MAX_ATTEMPTS = 30
-DEFAULT_SSH_RETRY_DELAY = 5
+DEFAULT_SSH_RETRY_DELAY = 1  # Initial wait_for_ssh retry delay, doubled per attempt
+SSH_RETRY_MAX_DELAY = 10  # Cap for the wait_for_ssh backoff
+SSH_CONNECT_TIMEOUT = 10  # ssh ConnectTimeout in seconds
+SSH_EARLY_CONNECT_TIMEOUT = 3  # ConnectTimeout for the first, usually failing, probes
+SSH_EARLY_ATTEMPTS = 3
+SSH_CONTROL_PERSIST = "10m"  # Keep the multiplexed master connection this long when idle
 
 # Latency test timeout model
 # TCP connection timeout is configurable via tcp_connection_timeout_ms in config.json
 # SSH timeout uses a large fixed value (30 minutes) as a safety net
 # Tests complete naturally when all TCP connections succeed or timeout
 
+# AWS API client retries (botocore jittered exponential backoff)
+AWS_MAX_ATTEMPTS = 4
+AWS_RETRY_MODE = "adaptive"
+AWS_MAX_POOL_CONNECTIONS = 20  # Shared by the main loop and concurrent cleanup threads
+AWS_CONNECT_TIMEOUT = 3  # seconds; fail fast and let the retry policy reconnect
+AWS_READ_TIMEOUT = 15  # seconds
+
+# Waiting for a launched instance to reach "running" (DescribeInstances backoff)
+WAIT_RUNNING_TIMEOUT = 150  # seconds
+WAIT_RUNNING_INITIAL_DELAY = 2  # seconds before the second poll
+WAIT_RUNNING_BACKOFF = 1.3  # delay multiplier per poll
+WAIT_RUNNING_MAX_DELAY = 15  # seconds
+
+# Concurrent candidate workers on Ctrl+C
+WORKER_SHUTDOWN_TIMEOUT = 90  # seconds to let workers reach a step boundary and clean up
+
+# Batched termination of failed candidates (one TerminateInstances call per batch)
+TERMINATE_BATCH_SIZE = 100  # Flush once this many instances are queued
+TERMINATE_BATCH_MAX_DELAY = 0.5  # seconds a queued instance may wait for its batch
+
+# Instance type selection: types are sampled with weight 1 / (floor + capacity
+# failure rate), the rate being an exponentially decaying average per type
+INSTANCE_TYPE_FAILURE_INITIAL = 0.1  # Starting failure rate for every type
+INSTANCE_TYPE_FAILURE_ALPHA = 0.3  # Weight of the latest launch outcome
+INSTANCE_TYPE_WEIGHT_FLOOR = 0.1  # Keeps weights finite; failing types are still retried
+
 # Thread cleanup settings
-CLEANUP_CHECK_DELAY = 10  # seconds
+CLEANUP_CHECK_DELAY = 10  # seconds; first termination poll interval
+CLEANUP_MAX_CHECK_DELAY = 60  # seconds; poll interval cap while nothing changes
 CLEANUP_MAX_ATTEMPTS = 180  # 30 minutes total (180 * 10 seconds)
 CLEANUP_FINAL_DELAY = 10  # seconds after termination
+CLEANUP_MAX_WORKERS = 8  # Concurrent PG + EIP cleanup tasks in total; the rest queue
 
 # Logging
 LOG_DATE_FORMAT = "%Y-%m-%d"
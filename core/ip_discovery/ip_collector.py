@@ -1,11 +1,18 @@
 """IP collection through DNS queries for the latency finder."""
 
-import subprocess
+import socket
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Set, Optional
 
+try:
+    import dns.resolver
+    HAS_DNSPYTHON = True
+except ImportError:
+    HAS_DNSPYTHON = False
+
 
 class IPCollector:
     """Collects IPs through periodic DNS queries."""
@@ -26,8 +33,13 @@ class IPCollector:
         self.queries_per_batch = queries_per_batch
         self.batch_interval = batch_interval
         self.dns_timeout = dns_timeout
-        self.running = False
         self.thread = None
+        # Set to stop the loop; also used for interruptible waits between queries
+        self._stop_event = threading.Event()
+        
+        # dnspython queries the configured nameservers directly; without it we
+        # fall back to the system resolver via getaddrinfo
+        self.resolver = dns.resolver.Resolver() if HAS_DNSPYTHON else None
         
         # Initialize with existing IPs if provided
         if existing_ips:
@@ -48,33 +60,17 @@ class IPCollector:
         Returns:
             List of IP addresses
         """
-        ips = []
         try:
-            result = subprocess.run(
-                ["host", domain],
-                capture_output=True,
-                text=True,
-                timeout=self.dns_timeout
-            )
+            if self.resolver is not None:
+                answer = self.resolver.resolve(domain, "A", lifetime=self.dns_timeout)
+                return [rdata.address for rdata in answer]
             
-            for line in result.stdout.splitlines():
-                parts = line.split()
-                if "has address" in line and len(parts) >= 4:
-                    ip = parts[-1]
-                    # Basic IP validation
-                    if '.' in ip and ip.count('.') == 3:
-                        try:
-                            octets = ip.split('.')
-                            if all(0 <= int(octet) <= 255 for octet in octets):
-                                ips.append(ip)
-                        except ValueError:
-                            pass
-        except subprocess.TimeoutExpired:
-            print(f"[WARN] DNS query timeout for {domain}")
+            addr_infos = socket.getaddrinfo(domain, 443, socket.AF_INET, socket.SOCK_STREAM)
+            # Preserve resolver order while dropping duplicates
+            return list(dict.fromkeys(info[4][0] for info in addr_infos))
         except Exception as e:
             print(f"[WARN] DNS query failed for {domain}: {e}")
-        
-        return ips
+            return []
     
     def collect_batch(self) -> Dict[str, Set[str]]:
         """Perform one batch of DNS queries.
@@ -84,18 +80,12 @@ class IPCollector:
         """
         new_ips = {domain: set() for domain in self.domains}
         
-        for domain in self.domains:
-            domain_new_ips = set()
-            
-            # Perform multiple queries
-            for i in range(self.queries_per_batch):
-                ips = self.resolve_domain(domain)
-                domain_new_ips.update(ips)
-                
-                # Small delay between queries to the same domain
-                if i < self.queries_per_batch - 1:
-                    time.sleep(0.5)
-            
+        # Query all domains concurrently; each worker spends its time blocked
+        # on DNS round trips and the 0.5s spacing between repeated queries
+        with ThreadPoolExecutor(max_workers=max(1, len(self.domains))) as executor:
+            domain_results = list(executor.map(self._query_domain, self.domains))
+        
+        for domain, domain_new_ips in zip(self.domains, domain_results):
             # Update collected IPs
             with self.lock:
                 # Find truly new IPs (not in our collected set)
@@ -116,6 +106,29 @@ class IPCollector:
         
         return new_ips
     
+    def _query_domain(self, domain: str) -> Set[str]:
+        """Query one domain queries_per_batch times and merge the answers.
+        
+        Args:
+            domain: Domain name to resolve
+            
+        Returns:
+            Set of IPs returned across all queries
+        """
+        domain_ips = set()
+        for i in range(self.queries_per_batch):
+            domain_ips.update(self.resolve_domain(domain))
+            
+            # Small delay between queries to the same domain
+            if i < self.queries_per_batch - 1:
+                self._stop_event.wait(0.5)
+        return domain_ips
+    
+    @property
+    def running(self) -> bool:
+        """Whether the background collection loop is active."""
+        return self.thread is not None and not self._stop_event.is_set()
+    
     def start(self, callback=None):
         """Start collecting IPs in background thread.
         
@@ -126,7 +139,7 @@ class IPCollector:
             print("[WARN] IP collector already running")
             return
         
-        self.running = True
+        self._stop_event.clear()
         self.thread = threading.Thread(target=self._collect_loop, args=(callback,))
         self.thread.daemon = True
         self.thread.start()
@@ -136,7 +149,7 @@ class IPCollector:
         if not self.running:
             return
         
-        self.running = False
+        self._stop_event.set()
         if self.thread:
             self.thread.join(timeout=5)
     
@@ -145,7 +158,7 @@ class IPCollector:
         batch_count = 0
         last_status_time = time.time()
         
-        while self.running:
+        while not self._stop_event.is_set():
             try:
                 # Collect batch
                 batch_count += 1
@@ -163,17 +176,15 @@ class IPCollector:
                 if current_time - last_status_time > 300:
                     last_status_time = current_time
                 
-                # Wait for next batch (unless stopping)
-                if self.running:
+                # Wait for next batch; returns early as soon as stop() is called
+                if not self._stop_event.is_set():
                     print(f"[INFO] Waiting {self.batch_interval}s for next DNS query batch...")
-                    for i in range(self.batch_interval):
-                        if not self.running:
-                            break
-                        time.sleep(1)
+                    if self._stop_event.wait(self.batch_interval):
+                        break
                         
             except Exception as e:
                 print(f"[ERROR] IP collection error: {e}")
-                time.sleep(5)  # Brief pause before retry
+                self._stop_event.wait(5)  # Brief pause before retry
     
     def get_collected_ips(self) -> Dict[str, List[str]]:
         """Get all collected IPs.
@@ -3,7 +3,25 @@
 import json
 import os
 import socket
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from .ip_persistence import WAL_FILENAME, read_wal_events
+
+
+def _resolve_domain(domain: str) -> Tuple[List[str], Optional[socket.gaierror]]:
+    """Resolve a domain's IPv4 addresses for the DNS fallback.
+    
+    Args:
+        domain: Domain name to resolve
+        
+    Returns:
+        Tuple of (unique IPs in resolver order, resolution error or None)
+    """
+    try:
+        infos = socket.getaddrinfo(domain, 443, socket.AF_INET, socket.SOCK_STREAM)
+    except socket.gaierror as e:
+        return [], e
+    return list(dict.fromkeys(info[4][0] for info in infos)), None
 
 
 def load_ip_list(ip_list_file: Optional[str] = None, domains: Optional[List[str]] = None) -> Optional[Dict[str, List[str]]]:
@@ -22,16 +40,27 @@ def load_ip_list(ip_list_file: Optional[str] = None, domains: Optional[List[str]
         Dictionary mapping domain names to lists of IPs, or None if loading fails
     """
     
+    # IPs discovered since the last snapshot are still in the journal next to it
+    wal_path = os.path.join(os.path.dirname(ip_list_file), WAL_FILENAME) if ip_list_file else None
+    
     # Try to load from file first
-    if ip_list_file and os.path.exists(ip_list_file):
+    if ip_list_file and (os.path.exists(ip_list_file) or os.path.exists(wal_path)):
         try:
-            with open(ip_list_file, 'r') as f:
-                ip_data = json.load(f)
+            ip_data = {"domains": {}}
+            if os.path.exists(ip_list_file):
+                with open(ip_list_file, 'r') as f:
+                    ip_data = json.load(f)
             
             # Extract IPs only for requested domains
             ip_list = {}
             all_domains = ip_data.get("domains", {})
             
+            # Merge journaled IPs on top of the snapshot
+            for event in read_wal_events(wal_path):
+                if event.get("event", "discovered") == "discovered":
+                    domain_data = all_domains.setdefault(event["domain"], {"ips": {}})
+                    domain_data["ips"].setdefault(event["ip"], {})
+            
             # If domains specified, filter to only those domains
             if domains:
                 for domain in domains:
@@ -57,22 +86,17 @@ def load_ip_list(ip_list_file: Optional[str] = None, domains: Optional[List[str]
         print("[INFO] IP list not found, falling back to DNS resolution")
         ip_list = {}
         
-        for domain in domains:
-            try:
-                # Get IPs from DNS
-                ips = []
-                for info in socket.getaddrinfo(domain, 443, socket.AF_INET, socket.SOCK_STREAM):
-                    ip = info[4][0]
-                    if ip not in ips:
-                        ips.append(ip)
-                
-                if ips:
-                    ip_list[domain] = ips
-                    print(f"  - {domain}: {len(ips)} IPs from DNS")
-                    
-            except socket.gaierror as e:
-                print(f"  - {domain}: DNS resolution failed: {e}")
+        # Resolve all domains concurrently; results are reported in domain order
+        with ThreadPoolExecutor(max_workers=len(domains)) as executor:
+            resolved = list(executor.map(_resolve_domain, domains))
+        
+        for domain, (ips, error) in zip(domains, resolved):
+            if error is not None:
+                print(f"  - {domain}: DNS resolution failed: {error}")
                 continue
+            if ips:
+                ip_list[domain] = ips
+                print(f"  - {domain}: {len(ips)} IPs from DNS")
         
         if ip_list:
             print("[INFO] Using DNS-resolved IPs (limited subset - run discover_ips.py for comprehensive list)")
@@ -5,11 +5,87 @@ import os
 import sys
 import tempfile
 import threading
+import time
+from collections import defaultdict
 from datetime import datetime
-from typing import Dict, Any, Set
+from typing import Dict, Any, List, Optional, Set
 from ..constants import UTC_PLUS_8
 from ..utils import ensure_directory_exists
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _dumps_indented(data: Any) -> bytes:
+    """Serialize data as 2-space indented JSON bytes, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+# Append-only journal of IP events, folded into ip_list_latest.json on sync
+WAL_FILENAME = "ip_list.wal"
+WAL_FSYNC_MAX_BYTES = 64 * 1024  # fsync once this many journaled bytes are pending
+WAL_BATCH_MAX_RECORDS = 32  # ...or once this many records are buffered
+WAL_FSYNC_TIMEOUT_SECONDS = 1.0  # ...or once the oldest pending record is this old
+WAL_COMPACT_RECORDS = 500  # Fold the journal into the snapshot after this many records
+WAL_COMPACT_SECONDS = 300  # ...or once the oldest journaled record is this old
+
+
+def last_validated_ts(ip_info: Dict[str, Any]) -> Optional[float]:
+    """Get an IP entry's last validation time as POSIX epoch seconds.
+    
+    Reads the cached "last_validated_ts" field. Entries written before that
+    field existed are parsed from the ISO "last_validated" string once and
+    the result is cached on the entry.
+    
+    Args:
+        ip_info: IP metadata dictionary
+        
+    Returns:
+        Epoch seconds, or None if the entry has no parseable timestamp
+    """
+    ts = ip_info.get("last_validated_ts")
+    if ts is not None:
+        return ts
+    last_validated = ip_info.get("last_validated")
+    if not last_validated:
+        return None
+    try:
+        ts = datetime.fromisoformat(last_validated).timestamp()
+    except (TypeError, ValueError):
+        return None
+    ip_info["last_validated_ts"] = ts
+    return ts
+
+
+def read_wal_events(wal_path: str) -> List[Dict[str, Any]]:
+    """Read events from an IP list write-ahead log.
+    
+    Malformed lines (e.g. a record torn by a crash mid-write) are skipped.
+    
+    Args:
+        wal_path: Path to the WAL file
+        
+    Returns:
+        List of event dictionaries in append order (empty if no WAL exists)
+    """
+    events = []
+    try:
+        with open(wal_path, 'r') as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(event, dict) and "domain" in event and "ip" in event:
+                    events.append(event)
+    except FileNotFoundError:
+        pass
+    return events
+
 
 class IPPersistence:
     """Manages loading and saving IP lists to disk."""
@@ -24,12 +100,23 @@ class IPPersistence:
         ensure_directory_exists(self.ip_lists_dir)
         self.latest_file = os.path.join(self.ip_lists_dir, "ip_list_latest.json")
         self.dead_ips_file = os.path.join(self.ip_lists_dir, "dead_ips.json")
+        self.wal_file = os.path.join(self.ip_lists_dir, WAL_FILENAME)
         
         # In-memory state
         self.active_data = None  # Loaded from disk
         self.dirty = False  # Track if active data needs saving
         self.lock = threading.Lock()  # Thread safety for background updates
         
+        # WAL batching state: encoded records not yet written, their size, and
+        # records journaled since the last snapshot. The journal is held open
+        # with O_APPEND so each batch costs one write() and one fsync().
+        self._wal_fd = None
+        self._wal_buffer = []
+        self._wal_pending_bytes = 0
+        self._wal_pending_since = None
+        self._wal_records = 0
+        self._wal_first_record_at = None
+        
         # Load initial state
         self._load_initial_state()
     
@@ -52,16 +139,173 @@ class IPPersistence:
                 self.active_data = {"last_updated": None, "domains": {}}
         else:
             self.active_data = {"last_updated": None, "domains": {}}
+        
+        # Replay events journaled since the last snapshot
+        self._replay_wal()
+    
+    def _replay_wal(self) -> None:
+        """Apply WAL events on top of the loaded snapshot."""
+        events = read_wal_events(self.wal_file)
+        replayed = 0
+        for event in events:
+            if event.get("event", "discovered") != "discovered":
+                continue
+            domains = self.active_data.setdefault("domains", {})
+            domain_data = domains.setdefault(event["domain"], {"count": 0, "ips": {}})
+            if event["ip"] not in domain_data["ips"]:
+                ts = event.get("ts") or datetime.now(UTC_PLUS_8).isoformat()
+                domain_data["ips"][event["ip"]] = {
+                    "first_seen": ts,
+                    "last_validated": ts
+                }
+                domain_data["count"] = len(domain_data["ips"])
+                replayed += 1
+        
+        if replayed:
+            self.dirty = True
+            print(f"[IP Persistence] Replayed {replayed} journaled IPs from {WAL_FILENAME}")
+    
+    def append_event(self, domain: str, ip: str, event_type: str = "discovered") -> None:
+        """Journal a single IP event without rewriting the snapshot.
+        
+        Records are buffered and written as one batch with a single write()
+        and fsync() once WAL_BATCH_MAX_RECORDS or WAL_FSYNC_MAX_BYTES are
+        pending, or the oldest pending record is older than
+        WAL_FSYNC_TIMEOUT_SECONDS (checked here and by flush_wal()). The event
+        is folded into ip_list_latest.json by maybe_compact() or the next sync,
+        after which the journal is truncated.
+        
+        Args:
+            domain: Domain name
+            ip: IP address
+            event_type: Event type (currently only "discovered" is replayed)
+        """
+        record = {
+            "ts": datetime.now(UTC_PLUS_8).isoformat(),
+            "event": event_type,
+            "domain": domain,
+            "ip": ip
+        }
+        line = (json.dumps(record) + "\n").encode("utf-8")
+        with self.lock:
+            now = time.monotonic()
+            if self._wal_pending_since is None:
+                self._wal_pending_since = now
+            if self._wal_first_record_at is None:
+                self._wal_first_record_at = now
+            self._wal_buffer.append(line)
+            self._wal_pending_bytes += len(line)
+            self._wal_records += 1
+            self._flush_wal_locked(force=False)
+    
+    def _flush_wal_locked(self, force: bool) -> None:
+        """Write and fsync buffered WAL records if a batch is due (lock held).
+        
+        Args:
+            force: Flush whenever anything is pending, ignoring thresholds
+        """
+        if not self._wal_buffer:
+            return
+        if not force:
+            age = time.monotonic() - self._wal_pending_since
+            if (len(self._wal_buffer) < WAL_BATCH_MAX_RECORDS
+                    and self._wal_pending_bytes < WAL_FSYNC_MAX_BYTES
+                    and age < WAL_FSYNC_TIMEOUT_SECONDS):
+                return
+        
+        if self._wal_fd is None:
+            self._wal_fd = os.open(self.wal_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        payload = b"".join(self._wal_buffer)
+        written = 0
+        while written < len(payload):
+            written += os.write(self._wal_fd, payload[written:])
+        os.fsync(self._wal_fd)
+        self._wal_buffer = []
+        self._wal_pending_bytes = 0
+        self._wal_pending_since = None
+    
+    def flush_wal(self, force: bool = False) -> None:
+        """fsync journaled records whose batch is full or has timed out.
+        
+        Meant to be called on a regular tick so a quiet period never leaves
+        records unsynced for much longer than WAL_FSYNC_TIMEOUT_SECONDS.
+        
+        Args:
+            force: fsync whenever anything is pending, ignoring thresholds
+        """
+        with self.lock:
+            self._flush_wal_locked(force)
+    
+    def seconds_until_wal_due(self) -> Optional[float]:
+        """Get the time until flush_wal() or maybe_compact() has work to do.
+        
+        Returns:
+            Seconds until the pending batch must be fsynced or the journal
+            compacted (may be <= 0 if overdue), or None if nothing is journaled
+        """
+        with self.lock:
+            now = time.monotonic()
+            deadlines = []
+            if self._wal_pending_since is not None:
+                deadlines.append(self._wal_pending_since + WAL_FSYNC_TIMEOUT_SECONDS)
+            if self._wal_first_record_at is not None:
+                deadlines.append(self._wal_first_record_at + WAL_COMPACT_SECONDS)
+            if not deadlines:
+                return None
+            return min(deadlines) - now
+    
+    def maybe_compact(self) -> bool:
+        """Fold the WAL into the snapshot once it is large or old enough.
+        
+        Returns:
+            True if a snapshot was written and the journal truncated
+        """
+        with self.lock:
+            if not self._wal_records:
+                return False
+            age = time.monotonic() - self._wal_first_record_at
+            if self._wal_records < WAL_COMPACT_RECORDS and age < WAL_COMPACT_SECONDS:
+                return False
+            self.active_data["last_updated"] = datetime.now(UTC_PLUS_8).isoformat()
+            self.dirty = True
+            self._sync_active_ips()
+            return True
+    
+    def _truncate_wal(self) -> None:
+        """Discard journaled events once a snapshot containing them is on disk."""
+        if self._wal_fd is not None:
+            os.ftruncate(self._wal_fd, 0)
+        elif os.path.exists(self.wal_file):
+            with open(self.wal_file, 'w'):
+                pass
+        self._wal_buffer = []
+        self._wal_pending_bytes = 0
+        self._wal_pending_since = None
+        self._wal_records = 0
+        self._wal_first_record_at = None
     
     def load_latest(self) -> Dict[str, Any]:
         """Get the current active IP data.
         
+        The returned structure is normalized so callers can index directly:
+        "domains" is a defaultdict that yields {"count": 0, "ips": {}} for
+        unknown domains, and every domain entry has an "ips" dict.
+        
+        The in-memory data is the single source of truth: the same object is
+        returned (no copy or JSON round trip), so updates made by the caller
+        are what the next sync writes.
+        
         Returns:
-            Dictionary with IP data (returns in-memory copy)
+            Dictionary with IP data (the live in-memory structure)
         """
         with self.lock:
-            # Return a deep copy to prevent external modifications
-            return json.loads(json.dumps(self.active_data))
+            ip_data = self.active_data
+            if not isinstance(ip_data.get("domains"), defaultdict):
+                domains = defaultdict(lambda: {"count": 0, "ips": {}}, ip_data.get("domains") or {})
+                for domain_data in domains.values():
+                    domain_data.setdefault("ips", {})
+                ip_data["domains"] = domains
+            return ip_data
     
     def save(self, ip_data: Dict[str, Any]) -> None:
         """Update in-memory data and mark as dirty.
@@ -106,27 +350,49 @@ class IPPersistence:
                 active_ips += 1
             domain_counts[domain_name] = (domain_active, domain_total)
         
-        # Atomic write: write to temp file then rename
-        temp_fd, temp_path = tempfile.mkstemp(dir=self.ip_lists_dir, text=True)
+        self._atomic_write_json(self.latest_file, self.active_data)
+        self.dirty = False
+        self._truncate_wal()
+        
+        # More detailed logging
+        print(f"\n[IP Persistence] Saved to {os.path.basename(self.latest_file)}:")
+        for domain, (active, total) in sorted(domain_counts.items()):
+            print(f"  - {domain}: {active} IPs")
+        print(f"[IP Persistence] Total: {active_ips} IPs across {len(domain_counts)} domains")
+    
+    def _atomic_write_json(self, path: str, data: Dict[str, Any]) -> None:
+        """Serialize data once and atomically replace path with it.
+        
+        The on-disk file is never read back; the payload is encoded in memory,
+        written to a temp file in the same directory, fsynced, then renamed,
+        and the directory is fsynced so the new entry is durable too.
+        
+        Args:
+            path: Destination file path
+            data: JSON-serializable data
+        """
+        payload = _dumps_indented(data)
+        temp_fd, temp_path = tempfile.mkstemp(dir=self.ip_lists_dir)
         try:
-            with os.fdopen(temp_fd, 'w') as f:
-                json.dump(self.active_data, f, indent=2)
-            # Atomic rename
-            os.replace(temp_path, self.latest_file)
-            self.dirty = False
-            
-            # More detailed logging
-            print(f"\n[IP Persistence] Saved to {os.path.basename(self.latest_file)}:")
-            for domain, (active, total) in sorted(domain_counts.items()):
-                print(f"  - {domain}: {active} IPs")
-            print(f"[IP Persistence] Total: {active_ips} IPs across {len(domain_counts)} domains")
-        except Exception as e:
+            with os.fdopen(temp_fd, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            # Atomic rename, then fsync the directory so the rename itself
+            # survives a crash
+            os.replace(temp_path, path)
+            dir_fd = os.open(self.ip_lists_dir, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except Exception:
             # Clean up temp file on error
             try:
                 os.unlink(temp_path)
-            except:
+            except OSError:
                 pass
-            raise e
+            raise
     
     def sync_to_disk(self) -> None:
         """Force sync of active IPs to disk if needed."""
@@ -159,13 +425,15 @@ class IPPersistence:
         if domain not in ip_data["domains"]:
             ip_data["domains"][domain] = {"count": 0, "ips": {}}
         
-        now = datetime.now(UTC_PLUS_8).isoformat()
+        now_dt = datetime.now(UTC_PLUS_8)
+        now = now_dt.isoformat()
         
         # Get or create IP entry with time-based tracking
         if ip not in ip_data["domains"][domain]["ips"]:
             ip_data["domains"][domain]["ips"][ip] = {
                 "first_seen": now,
-                "last_validated": now
+                "last_validated": now,
+                "last_validated_ts": now_dt.timestamp()
             }
             # Update count
             ip_data["domains"][domain]["count"] = len(ip_data["domains"][domain]["ips"])
@@ -174,6 +442,45 @@ class IPPersistence:
         if ip_data is self.active_data:
             self.dirty = True
     
+    def bulk_update_ips(self, ip_data: Dict[str, Any], domain: str, ips: Set[str],
+                        now: Optional[str] = None) -> int:
+        """Add newly discovered IPs for a domain in one dict update.
+        
+        IPs that already exist keep their metadata, matching update_ip().
+        
+        Args:
+            ip_data: IP data structure to update (can be external or internal)
+            domain: Domain name
+            ips: IP addresses discovered together
+            now: Optional ISO timestamp shared by all entries (defaults to now)
+            
+        Returns:
+            Number of IPs actually added
+        """
+        if "domains" not in ip_data:
+            ip_data["domains"] = {}
+        if domain not in ip_data["domains"]:
+            ip_data["domains"][domain] = {"count": 0, "ips": {}}
+        
+        if now is None:
+            now = datetime.now(UTC_PLUS_8).isoformat()
+        now_ts = datetime.fromisoformat(now).timestamp()
+        
+        domain_ips = ip_data["domains"][domain]["ips"]
+        new_entries = {
+            ip: {"first_seen": now, "last_validated": now, "last_validated_ts": now_ts}
+            for ip in ips if ip not in domain_ips
+        }
+        if new_entries:
+            domain_ips.update(new_entries)
+            ip_data["domains"][domain]["count"] = len(domain_ips)
+            
+            # If updating internal data, mark as dirty
+            if ip_data is self.active_data:
+                self.dirty = True
+        
+        return len(new_entries)
+    
     def update_ip_validation_time(self, ip_data: Dict[str, Any], domain: str, ip: str) -> None:
         """Update the validation timestamp for a specific IP.
         
@@ -189,8 +496,43 @@ class IPPersistence:
             # IP doesn't exist, create it first
             self.update_ip(ip_data, domain, ip)
         
-        # Update last_validated timestamp
-        ip_data["domains"][domain]["ips"][ip]["last_validated"] = datetime.now(UTC_PLUS_8).isoformat()
+        # Update last_validated timestamp (ISO for humans, epoch for comparisons)
+        now_dt = datetime.now(UTC_PLUS_8)
+        ip_info = ip_data["domains"][domain]["ips"][ip]
+        ip_info["last_validated"] = now_dt.isoformat()
+        ip_info["last_validated_ts"] = now_dt.timestamp()
+        
+        # If updating internal data, mark as dirty
+        if ip_data is self.active_data:
+            self.dirty = True
+    
+    def bulk_update_validation_time(self, ip_data: Dict[str, Any], domain: str,
+                                    ips: List[str], now: Optional[str] = None) -> None:
+        """Update the validation timestamp for many IPs of one domain.
+        
+        Equivalent to calling update_ip_validation_time() per IP, but computes
+        the timestamp once and resolves the domain's IP dict once.
+        
+        Args:
+            ip_data: IP data structure to update
+            domain: Domain name
+            ips: IP addresses that were successfully validated
+            now: Optional ISO timestamp shared by all entries (defaults to now)
+        """
+        if not ips:
+            return
+        if now is None:
+            now = datetime.now(UTC_PLUS_8).isoformat()
+        
+        # Create entries for IPs we have not seen before
+        self.bulk_update_ips(ip_data, domain, set(ips), now=now)
+        
+        now_ts = datetime.fromisoformat(now).timestamp()
+        domain_ips = ip_data["domains"][domain]["ips"]
+        for ip in ips:
+            ip_info = domain_ips[ip]
+            ip_info["last_validated"] = now
+            ip_info["last_validated_ts"] = now_ts
         
         # If updating internal data, mark as dirty
         if ip_data is self.active_data:
@@ -209,7 +551,7 @@ class IPPersistence:
             Dictionary of domain -> list of IPs (only live IPs unless include_dead=True)
         """
         result = {}
-        current_time = datetime.now(UTC_PLUS_8)
+        now_ts = time.time()
         dead_threshold_seconds = 3600  # 1 hour
         
         for domain, domain_data in ip_data.get("domains", {}).items():
@@ -219,20 +561,10 @@ class IPPersistence:
                 if include_dead:
                     domain_ips.append(ip)
                 else:
-                    # Check if IP is still alive based on last validation time
-                    last_validated = ip_info.get("last_validated")
-                    if last_validated:
-                        try:
-                            last_validated_dt = datetime.fromisoformat(last_validated)
-                            time_since_validation = (current_time - last_validated_dt).total_seconds()
-                            
-                            if time_since_validation <= dead_threshold_seconds:
-                                domain_ips.append(ip)
-                        except:
-                            # If parsing fails, include the IP
-                            domain_ips.append(ip)
-                    else:
-                        # No validation timestamp, include the IP
+                    # Check if IP is still alive based on last validation time;
+                    # IPs without a parseable timestamp are included
+                    validated_ts = last_validated_ts(ip_info)
+                    if validated_ts is None or now_ts - validated_ts <= dead_threshold_seconds:
                         domain_ips.append(ip)
             
             if domain_ips:
@@ -244,6 +576,7 @@ class IPPersistence:
         """Move dead IPs from active list to dead IP file."""
         with self.lock:
             current_time = datetime.now(UTC_PLUS_8)
+            now_ts = current_time.timestamp()
             dead_threshold_seconds = 3600  # 1 hour
             
             # Load existing dead IPs
@@ -253,7 +586,7 @@ class IPPersistence:
                     with open(self.dead_ips_file, 'r') as f:
                         dead_data = json.load(f)
                         dead_ips = dead_data.get("ips", {})
-                except:
+                except (OSError, json.JSONDecodeError, AttributeError):
                     dead_ips = {}
             
             # Find and move dead IPs
@@ -262,38 +595,32 @@ class IPPersistence:
                 ips_to_remove = []
                 
                 for ip, ip_info in domain_data["ips"].items():
-                    last_validated = ip_info.get("last_validated")
-                    if last_validated:
+                    validated_ts = last_validated_ts(ip_info)
+                    if validated_ts is None or now_ts - validated_ts <= dead_threshold_seconds:
+                        continue
+                    
+                    # Calculate lifespan
+                    first_seen = ip_info.get("first_seen")
+                    lifespan_hours = None
+                    if first_seen:
                         try:
-                            last_validated_dt = datetime.fromisoformat(last_validated)
-                            time_since_validation = (current_time - last_validated_dt).total_seconds()
-                            
-                            if time_since_validation > dead_threshold_seconds:
-                                # Calculate lifespan
-                                first_seen = ip_info.get("first_seen")
-                                lifespan_hours = None
-                                if first_seen:
-                                    try:
-                                        first_seen_dt = datetime.fromisoformat(first_seen)
-                                        lifespan = last_validated_dt - first_seen_dt
-                                        lifespan_hours = lifespan.total_seconds() / 3600
-                                    except:
-                                        pass
-                                
-                                # Add to dead IPs
-                                dead_key = f"{domain}:{ip}"
-                                dead_ips[dead_key] = {
-                                    "domain": domain,
-                                    "ip": ip,
-                                    "first_seen": first_seen,
-                                    "last_validated": last_validated,
-                                    "declared_dead": current_time.isoformat(),
-                                    "lifespan_hours": round(lifespan_hours, 2) if lifespan_hours else None
-                                }
-                                ips_to_remove.append(ip)
-                                moved_count += 1
-                        except:
+                            first_seen_ts = datetime.fromisoformat(first_seen).timestamp()
+                            lifespan_hours = (validated_ts - first_seen_ts) / 3600
+                        except (TypeError, ValueError):
                             pass
+                    
+                    # Add to dead IPs
+                    dead_key = f"{domain}:{ip}"
+                    dead_ips[dead_key] = {
+                        "domain": domain,
+                        "ip": ip,
+                        "first_seen": first_seen,
+                        "last_validated": ip_info.get("last_validated"),
+                        "declared_dead": current_time.isoformat(),
+                        "lifespan_hours": round(lifespan_hours, 2) if lifespan_hours else None
+                    }
+                    ips_to_remove.append(ip)
+                    moved_count += 1
                 
                 # Remove dead IPs from active list
                 for ip in ips_to_remove:
@@ -312,18 +639,10 @@ class IPPersistence:
                     "ips": dead_ips
                 }
                 
-                # Atomic write
-                temp_fd, temp_path = tempfile.mkstemp(dir=self.ip_lists_dir, text=True)
                 try:
-                    with os.fdopen(temp_fd, 'w') as f:
-                        json.dump(dead_data, f, indent=2)
-                    os.replace(temp_path, self.dead_ips_file)
+                    self._atomic_write_json(self.dead_ips_file, dead_data)
                     print(f"[IP Persistence] Moved {moved_count} dead IPs to dead_ips.json")
                 except Exception as e:
-                    try:
-                        os.unlink(temp_path)
-                    except:
-                        pass
                     print(f"[ERROR] Failed to save dead IPs: {e}")
     
     def shutdown(self) -> None:
@@ -335,6 +654,11 @@ class IPPersistence:
             if self.dirty:
                 print("[IP Discovery] Syncing final changes to disk...")
                 self._sync_active_ips()
+            else:
+                self._flush_wal_locked(force=True)
+            if self._wal_fd is not None:
+                os.close(self._wal_fd)
+                self._wal_fd = None
         
         # Verify files exist
         if os.path.exists(self.latest_file):
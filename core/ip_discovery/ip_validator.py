@@ -1,8 +1,9 @@
 """IP validation and liveness checking for the latency finder."""
 
+import asyncio
 import socket
 import time
-from typing import Dict, Tuple, List
+from typing import Callable, Dict, Tuple, List, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
@@ -45,15 +46,19 @@ class IPValidator:
         except (socket.error, socket.timeout):
             return False, -1
     
-    def validate_ips(self, ips: List[str], show_progress: bool = True) -> Dict[str, Tuple[bool, float]]:
+    def validate_ips(self, ips: List[str], show_progress: bool = True,
+                     cancel_check: Optional[Callable[[], bool]] = None) -> Dict[str, Tuple[bool, float]]:
         """Validate multiple IPs concurrently.
         
         Args:
             ips: List of IP addresses to validate
             show_progress: Whether to print progress messages
+            cancel_check: Optional callable polled after each completed probe;
+                when it returns True, pending probes are cancelled
             
         Returns:
-            Dictionary of ip -> (is_alive, latency_ms)
+            Dictionary of ip -> (is_alive, latency_ms). When cancelled, IPs
+            that were never probed are omitted.
         """
         results = {}
         
@@ -70,6 +75,11 @@ class IPValidator:
             # Collect results
             completed = 0
             for future in as_completed(future_to_ip):
+                if cancel_check and cancel_check():
+                    # Drop queued probes; in-flight ones finish within the timeout
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
+                
                 ip = future_to_ip[future]
                 try:
                     is_alive, latency = future.result()
@@ -90,27 +100,99 @@ class IPValidator:
         return results
     
     def validate_domain_ips(self, domain_ips: Dict[str, List[str]], 
-                          show_progress: bool = True) -> Dict[str, Dict[str, Tuple[bool, float]]]:
+                          show_progress: bool = True,
+                          cancel_check: Optional[Callable[[], bool]] = None
+                          ) -> Dict[str, Dict[str, Tuple[bool, float]]]:
         """Validate IPs grouped by domain.
         
+        Runs validate_domain_ips_async on a private event loop, so every IP
+        across every domain is probed concurrently rather than domain by domain.
+        
         Args:
             domain_ips: Dictionary of domain -> list of IPs
             show_progress: Whether to print progress messages
+            cancel_check: Optional callable; probes not yet started are skipped
+                once it returns True
             
         Returns:
-            Dictionary of domain -> {ip -> (is_alive, latency_ms)}
+            Dictionary of domain -> {ip -> (is_alive, latency_ms)}. When
+            cancelled, skipped IPs are omitted.
         """
-        results = {}
+        return asyncio.run(self.validate_domain_ips_async(
+            domain_ips, show_progress=show_progress, cancel_check=cancel_check
+        ))
+    
+    async def _validate_ip_async(self, ip: str, semaphore: asyncio.Semaphore,
+                                 cancel_check: Optional[Callable[[], bool]] = None
+                                 ) -> Optional[Tuple[bool, float]]:
+        """Validate a single IP with a non-blocking TCP connection.
         
-        for domain, ips in domain_ips.items():
-            if show_progress:
-                print(f"\n[INFO] Validating {domain} IPs...")
+        Args:
+            ip: IP address to validate
+            semaphore: Semaphore bounding the number of concurrent connections
+            cancel_check: Optional callable; when it returns True the probe is skipped
+            
+        Returns:
+            Tuple of (is_alive, latency_ms), or None if skipped due to cancellation
+        """
+        async with semaphore:
+            if cancel_check and cancel_check():
+                return None
             
-            domain_results = self.validate_ips(ips, show_progress=False)
-            results[domain] = domain_results
+            start_time = time.perf_counter()
+            try:
+                _, writer = await asyncio.wait_for(
+                    asyncio.open_connection(ip, self.port), timeout=self.timeout
+                )
+            except (OSError, asyncio.TimeoutError):
+                return False, -1
+            elapsed = (time.perf_counter() - start_time) * 1000  # Convert to ms
             
-            if show_progress:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+            return True, elapsed
+    
+    async def validate_domain_ips_async(self, domain_ips: Dict[str, List[str]],
+                                        show_progress: bool = True, concurrency: int = 256,
+                                        cancel_check: Optional[Callable[[], bool]] = None
+                                        ) -> Dict[str, Dict[str, Tuple[bool, float]]]:
+        """Validate IPs grouped by domain on a single event loop.
+        
+        All probes across all domains run concurrently (bounded by concurrency),
+        so wall time is roughly one connect timeout instead of one per batch.
+        
+        Args:
+            domain_ips: Dictionary of domain -> list of IPs
+            show_progress: Whether to print progress messages
+            concurrency: Maximum simultaneous connection attempts
+            cancel_check: Optional callable; probes not yet started are skipped
+                once it returns True
+            
+        Returns:
+            Dictionary of domain -> {ip -> (is_alive, latency_ms)}. When
+            cancelled, skipped IPs are omitted.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        pairs = [(domain, ip) for domain, ips in domain_ips.items() for ip in ips]
+        
+        if show_progress:
+            print(f"[INFO] Validating {len(pairs)} IPs across {len(domain_ips)} domains...")
+        
+        outcomes = await asyncio.gather(
+            *(self._validate_ip_async(ip, semaphore, cancel_check) for _, ip in pairs)
+        )
+        
+        results = {domain: {} for domain in domain_ips}
+        for (domain, ip), outcome in zip(pairs, outcomes):
+            if outcome is not None:
+                results[domain][ip] = outcome
+        
+        if show_progress:
+            for domain, domain_results in results.items():
                 alive_count = sum(1 for alive, _ in domain_results.values() if alive)
-                print(f"[INFO] {domain}: {alive_count}/{len(ips)} IPs responded successfully")
+                print(f"[INFO] {domain}: {alive_count}/{len(domain_ips[domain])} IPs responded successfully")
         
-        return results
\ No newline at end of file
+        return results
@@ -0,0 +1,434 @@
+"""Continuous IP discovery logic for the latency finder."""
+
+import os
+import sys
+import time
+import signal
+import json
+import heapq
+import random
+import threading
+from datetime import datetime
+from operator import itemgetter
+from typing import Dict, List, Set
+
+from .config import Config
+from .ip_discovery import IPCollector, IPValidator, IPPersistence
+from .ip_discovery.ip_persistence import last_validated_ts
+from .constants import UTC_PLUS_8
+
+VALIDATION_INTERVAL_SECONDS = 600  # Periodic validation cadence (10 minutes)
+
+# Periodic validation probes a sample of healthy IPs; see _select_validation_sample
+VALIDATION_SAMPLE_FRACTION = 0.25  # Share of healthy IPs probed per cycle
+FULL_SWEEP_INTERVAL_SECONDS = 3600  # Probe every IP at least this often
+STALE_REVALIDATE_SECONDS = 1800  # Always probe IPs not validated for this long
+
+
+class IPDiscoveryTool:
+    """Continuous IP discovery and management tool."""
+    
+    def __init__(self, config: Config):
+        """Initialize IP discovery tool."""
+        self.config = config
+        self.persistence = IPPersistence(config.ip_list_dir)
+        self.validator = IPValidator()
+        self._stop = threading.Event()
+        # Wakes the main loop early: set on shutdown and when IPs are journaled
+        self._wake = threading.Event()
+        self.collector = None
+        self.ip_data = None
+        self.session_new_count = 0
+        
+        # IPs whose most recent probe failed, always re-probed by sampled cycles
+        self._suspect_ips: Dict[str, Set[str]] = {}
+        self._next_full_sweep = time.time() + FULL_SWEEP_INTERVAL_SECONDS
+        
+        # Set up signal handlers
+        signal.signal(signal.SIGINT, self._signal_handler)
+        signal.signal(signal.SIGTERM, self._signal_handler)
+    
+    def _signal_handler(self, signum, frame):
+        """Handle shutdown signals."""
+        print(f"\n[INFO] Shutting down gracefully...")
+        self._stop.set()
+        self._wake.set()
+        if self.collector:
+            self.collector.stop()
+    
+    def run(self):
+        """Run continuous IP discovery."""
+        print("[INFO] Starting IP discovery (Ctrl+C to stop)")
+        print("[INFO] DNS queries every 60 seconds, validation every 10 minutes")
+        
+        # Load existing IP data
+        self.ip_data = self.persistence.load_latest()
+        
+        # Count discovery-domain and whole-file IPs in a single sweep of the file
+        discovery_set = set(self.config.discovery_domains)
+        discovery_ip_count = 0
+        discovery_domains_with_ips = 0
+        total_file_domains = 0  # Domains that actually hold IPs
+        total_file_ips = 0
+        
+        for domain, domain_data in self.ip_data["domains"].items():
+            ip_count = len(domain_data["ips"])
+            if not ip_count:
+                continue
+            total_file_domains += 1
+            total_file_ips += ip_count
+            if domain in discovery_set:
+                discovery_ip_count += ip_count
+                discovery_domains_with_ips += 1
+        
+        if discovery_ip_count > 0:
+            print(f"[INFO] Loaded {discovery_ip_count} IPs for {discovery_domains_with_ips}/{len(self.config.discovery_domains)} discovery domains")
+            if total_file_domains > len(self.config.discovery_domains):
+                print(f"[INFO] (IP file contains {total_file_ips} total IPs across {total_file_domains} domains)")
+        
+        # Run initial validation on ALL discovery domain IPs regardless of last validation time
+        print(f"\n[INFO] Running initial validation on all discovery domain IPs...")
+        self._run_initial_validation()
+        
+        # Extract existing IPs for the collector after cleanup (dead IPs have been moved)
+        domains = self.ip_data["domains"]
+        existing_ips = {}
+        for domain in self.config.discovery_domains:
+            domain_data = domains.get(domain)
+            existing_ips[domain] = set(domain_data["ips"]) if domain_data else set()
+        
+        # Create collector with existing IPs
+        self.collector = IPCollector(self.config.discovery_domains, existing_ips=existing_ips)
+        
+        # Track stats
+        self.session_new_count = 0
+        self.last_validation_time = time.time()
+        
+        # Start continuous collection
+        self.collector.start(callback=self._on_new_ips)
+        print("[INFO] Monitoring for new IPs...\n")
+        
+        try:
+            while not self._stop.is_set():
+                # Check if it's time for validation (every 10 minutes)
+                current_time = time.time()
+                if current_time - self.last_validation_time >= VALIDATION_INTERVAL_SECONDS:
+                    self._run_validation()
+                    self.last_validation_time = current_time
+                
+                # Batched WAL fsync and periodic compaction into the snapshot
+                self.persistence.flush_wal()
+                self.persistence.maybe_compact()
+                
+                # Sleep until the next validation or WAL deadline; new IPs and
+                # shutdown signals set _wake so the deadlines are recomputed
+                timeout = VALIDATION_INTERVAL_SECONDS - (time.time() - self.last_validation_time)
+                wal_due = self.persistence.seconds_until_wal_due()
+                if wal_due is not None:
+                    timeout = min(timeout, wal_due)
+                self._wake.wait(timeout=max(0.0, timeout))
+                self._wake.clear()
+                
+        except KeyboardInterrupt:
+            pass
+        finally:
+            # Clean shutdown
+            print("\n[INFO] Performing final validation before shutdown...")
+            self.collector.stop()
+            self._run_validation(cancellable=False, full=True)
+            self._print_session_summary()
+            self.persistence.shutdown()
+    
+    def _on_new_ips(self, domain, new_ips):
+        """Callback for new IPs found by the collector - journal immediately."""
+        # Add all new IPs with one shared timestamp and append them to the
+        # WAL; the snapshot is rewritten on compaction, validation and shutdown
+        self.session_new_count += self.persistence.bulk_update_ips(self.ip_data, domain, new_ips)
+        for ip in new_ips:
+            self.persistence.append_event(domain, ip)
+        if new_ips:
+            print(f"[INFO] Found and journaled {len(new_ips)} new IPs for {domain}")
+            # Let the main loop schedule the batched fsync for these records
+            self._wake.set()
+    
+    def _run_initial_validation(self):
+        """Run initial validation on all discovery domain IPs.
+        
+        This validates ALL IPs regardless of their last validation timestamp
+        to ensure newly added domains don't have their IPs incorrectly marked as dead.
+        """
+        # Get ALL IPs for discovery domains (including those that might be considered "dead")
+        all_ips = {}
+        domains = self.ip_data["domains"]
+        for domain in self.config.discovery_domains:
+            domain_data = domains.get(domain)
+            if domain_data and domain_data["ips"]:
+                all_ips[domain] = list(domain_data["ips"])
+        
+        if not all_ips:
+            print("[INFO] No discovery domain IPs to validate")
+            return
+        
+        total_ips = sum(len(ips) for ips in all_ips.values())
+        print(f"[INFO] Validating {total_ips} IPs from {len(all_ips)} discovery domains")
+        
+        # Validate all IPs (aborts early on shutdown; the final validation covers it)
+        validation_results = self.validator.validate_domain_ips(
+            all_ips, show_progress=False, cancel_check=self._stop.is_set
+        )
+        if self._stop.is_set():
+            print("[INFO] Initial validation interrupted by shutdown")
+            return
+        
+        # Update timestamps for alive IPs, check dead criteria for failed IPs
+        alive_count = 0
+        dead_count = 0
+        current_time = datetime.now(UTC_PLUS_8)
+        now_ts = current_time.timestamp()
+        dead_threshold_seconds = 3600  # 1 hour
+        validated_at = current_time.isoformat()
+        
+        for domain, results in validation_results.items():
+            alive_ips = []
+            suspects = self._suspect_ips.setdefault(domain, set())
+            for ip, (is_alive, latency) in results.items():
+                if is_alive:
+                    alive_ips.append(ip)
+                    alive_count += 1
+                else:
+                    suspects.add(ip)
+                    # Check if it should be considered dead (failed AND >1 hour since last validation)
+                    validated_ts = last_validated_ts(self.ip_data["domains"][domain]["ips"][ip])
+                    if validated_ts is not None and now_ts - validated_ts > dead_threshold_seconds:
+                        dead_count += 1
+            
+            # Update validation timestamps for the whole domain at once
+            self.persistence.bulk_update_validation_time(self.ip_data, domain, alive_ips, now=validated_at)
+        
+        print(f"[INFO] Initial validation complete: {alive_count}/{total_ips} IPs responded")
+        if dead_count > 0:
+            print(f"[INFO] {dead_count} IPs are dead (failed validation AND >1 hour since last success)")
+        
+        # Save and move dead IPs
+        self.persistence.save_and_sync(self.ip_data)
+        self.persistence.move_dead_ips_to_history()
+        
+        # Update last validation time so we don't immediately run another validation
+        self.last_validation_time = time.time()
+        print("[INFO] Initial cleanup complete\n")
+    
+    def _select_validation_sample(self, discovery_ips: Dict[str, List[str]]) -> Dict[str, List[str]]:
+        """Pick the IPs to probe in a sampled (non-full) validation cycle.
+        
+        Suspect IPs (failed their last probe) and IPs not validated for
+        STALE_REVALIDATE_SECONDS are always probed, so a live IP can never age
+        past the 1-hour dead threshold just because it was not sampled. A
+        random VALIDATION_SAMPLE_FRACTION of the remaining healthy IPs is added.
+        
+        Args:
+            discovery_ips: Dictionary of domain -> list of active IPs
+            
+        Returns:
+            Dictionary of domain -> list of IPs to probe this cycle
+        """
+        now_ts = time.time()
+        selected = {}
+        
+        for domain, ips in discovery_ips.items():
+            suspects = self._suspect_ips.get(domain, set())
+            domain_entries = self.ip_data["domains"][domain]["ips"]
+            must_probe = []
+            healthy = []
+            
+            for ip in ips:
+                validated_ts = last_validated_ts(domain_entries[ip])
+                age = float("inf") if validated_ts is None else now_ts - validated_ts
+                
+                if ip in suspects or age >= STALE_REVALIDATE_SECONDS:
+                    must_probe.append(ip)
+                else:
+                    healthy.append(ip)
+            
+            sample_size = min(len(healthy), max(1, round(len(healthy) * VALIDATION_SAMPLE_FRACTION)))
+            domain_selection = must_probe + random.sample(healthy, sample_size)
+            if domain_selection:
+                selected[domain] = domain_selection
+        
+        return selected
+    
+    def _run_validation(self, cancellable: bool = True, full: bool = False):
+        """Run validation on discovery IPs and update validation timestamps.
+        
+        Cycles probe a sample of IPs (see _select_validation_sample) except
+        when a full sweep is due or explicitly requested.
+        
+        Args:
+            cancellable: Abort early when shutdown is requested. The final
+                validation on shutdown passes False so it always completes.
+            full: Probe every active IP regardless of the sampling schedule
+        """
+        print("\n[INFO] Running IP validation...")
+        
+        # Get all IPs for validation (from all domains in the file)
+        all_active_ips = self.persistence.get_all_active_ips(self.ip_data)
+        
+        # Only validate discovery domains; walk the short discovery list and
+        # look each one up, rather than filtering every domain in the file
+        discovery_ips = {}
+        for domain in self.config.discovery_domains:
+            ips = all_active_ips.get(domain)
+            if ips:
+                discovery_ips[domain] = ips
+        
+        if not discovery_ips:
+            print("[INFO] No discovery domain IPs to validate")
+            return
+        
+        total_active = sum(len(ips) for ips in discovery_ips.values())
+        full = full or time.time() >= self._next_full_sweep
+        if not full:
+            discovery_ips = self._select_validation_sample(discovery_ips)
+            
+        print(f"[INFO] Validating {sum(len(ips) for ips in discovery_ips.values())} of {total_active} IPs "
+              f"from {len(discovery_ips)} discovery domains ({'full sweep' if full else 'sampled'})")
+        cancel_check = self._stop.is_set if cancellable else None
+        validation_results = self.validator.validate_domain_ips(
+            discovery_ips, show_progress=False, cancel_check=cancel_check
+        )
+        if cancellable and self._stop.is_set():
+            # Partial results are discarded; the shutdown path revalidates everything
+            print("[INFO] Validation interrupted by shutdown")
+            return
+        
+        # Track statistics; output lines are buffered and written in one call
+        summary_stats = {"alive": 0, "failed": 0}
+        msgs = []
+        validated_at = datetime.now(UTC_PLUS_8).isoformat()
+        
+        for domain, results in validation_results.items():
+            # Failed validations leave the timestamp untouched
+            alive_ips = [ip for ip, (is_alive, _) in results.items() if is_alive]
+            failed_ips = [ip for ip, (is_alive, _) in results.items() if not is_alive]
+            domain_stats = {"alive": len(alive_ips), "failed": len(failed_ips)}
+            summary_stats["alive"] += domain_stats["alive"]
+            summary_stats["failed"] += domain_stats["failed"]
+            
+            # Remember failures so sampled cycles keep probing them
+            suspects = self._suspect_ips.setdefault(domain, set())
+            suspects.difference_update(alive_ips)
+            suspects.update(failed_ips)
+            
+            # Update last_validated for all successful IPs in one pass
+            self.persistence.bulk_update_validation_time(self.ip_data, domain, alive_ips, now=validated_at)
+            
+            # Domain summary
+            msgs.append(f"  - {domain}: {domain_stats['alive']} alive, {domain_stats['failed']} failed")
+        
+        if msgs:
+            sys.stdout.write("\n".join(msgs) + "\n")
+        
+        if full:
+            self._next_full_sweep = time.time() + FULL_SWEEP_INTERVAL_SECONDS
+        
+        # Save updated IP data
+        self.persistence.save_and_sync(self.ip_data)
+        
+        # Move dead IPs to history
+        self.persistence.move_dead_ips_to_history()
+        
+        # Check for dead IPs based on time threshold
+        now_ts = time.time()
+        dead_threshold_seconds = 3600  # 1 hour
+        dead_count = 0
+        msgs = []
+        
+        domains = self.ip_data["domains"]
+        for domain in self.config.discovery_domains:
+            # .get() so domains without IPs are not materialized by the defaultdict
+            domain_data = domains.get(domain)
+            if not domain_data:
+                continue
+            for ip, ip_info in domain_data["ips"].items():
+                validated_ts = last_validated_ts(ip_info)
+                if validated_ts is None:
+                    continue
+                time_since_validation = now_ts - validated_ts
+                if time_since_validation > dead_threshold_seconds:
+                    dead_count += 1
+                    minutes_dead = int(time_since_validation / 60)
+                    msgs.append(f"    - {domain} {ip}: Dead (not validated for {minutes_dead} minutes)")
+        
+        # Validation summary
+        msgs.append(f"\n[Validation Summary] Total: {summary_stats['alive']} alive, "
+                    f"{summary_stats['failed']} failed, {dead_count} dead (>1 hour)")
+        msgs.append("[INFO] Validation complete\n")
+        sys.stdout.write("\n".join(msgs) + "\n")
+    
+    def _print_session_summary(self):
+        """Print summary of the session."""
+        print("\n" + "="*60)
+        print("SESSION SUMMARY")
+        print("="*60)
+        
+        # Show discovery domains only
+        print("\nDiscovery Domains Status:")
+        discovery_total = 0
+        
+        # Count IPs by time-based status against one reference time
+        now_ts = time.time()
+        dead_threshold_seconds = 3600  # 1 hour
+        warning_threshold_seconds = 2700  # 45 minutes
+        
+        for domain in self.config.discovery_domains:
+            domain_ips = self.persistence.get_domain_ips(self.ip_data, domain)
+            domain_total = len(domain_ips)
+            discovery_total += domain_total
+            
+            dead_ips = []
+            warning_ips = []
+            
+            for ip, ip_info in domain_ips.items():
+                validated_ts = last_validated_ts(ip_info)
+                if validated_ts is None:
+                    continue
+                time_since_validation = now_ts - validated_ts
+                if time_since_validation > dead_threshold_seconds:
+                    dead_ips.append((ip, int(time_since_validation / 60)))
+                elif time_since_validation > warning_threshold_seconds:
+                    warning_ips.append((ip, int(time_since_validation / 60)))
+            
+            if dead_ips or warning_ips:
+                print(f"  - {domain}: {domain_total} IPs ({len(dead_ips)} dead, {len(warning_ips)} warning)")
+                # Show IPs close to being dead
+                for ip, minutes in heapq.nlargest(3, warning_ips, key=itemgetter(1)):  # 3 oldest
+                    print(f"      Warning: {ip} not validated for {minutes} minutes")
+                if len(warning_ips) > 3:
+                    print(f"      ... and {len(warning_ips) - 3} more approaching dead status")
+            else:
+                print(f"  - {domain}: {domain_total} IPs (all healthy)")
+        
+        # Show file totals if different
+        total_file_domains = sum(1 for d in self.ip_data["domains"].values() if d["ips"])
+        total_file_ips = sum(len(d["ips"]) for d in self.ip_data["domains"].values())
+        
+        print(f"\nNew IPs discovered this session: {self.session_new_count}")
+        print(f"Discovery domains tracked: {discovery_total} IPs")
+        
+        if total_file_domains > len(self.config.discovery_domains):
+            print(f"Total in IP file: {total_file_ips} IPs across {total_file_domains} domains")
+        
+        print(f"Dead IP threshold: 1 hour without successful validation")
+        
+        # Show dead IP file info if it exists
+        dead_ips_file = os.path.join(self.config.ip_list_dir, "dead_ips.json")
+        if os.path.exists(dead_ips_file):
+            try:
+                with open(dead_ips_file, 'r') as f:
+                    dead_data = json.load(f)
+                    dead_count = dead_data.get("total_count", 0)
+                    print(f"Dead IPs in history: {dead_count} (see dead_ips.json)")
+            except (OSError, json.JSONDecodeError):
+                pass
+        
+        print("="*60)
+
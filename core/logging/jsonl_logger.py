@@ -2,7 +2,7 @@
 
 import json
 import os
-from typing import Dict, Any
+from typing import Dict, Any, TextIO
 
 
 class JSONLLogger:
@@ -15,6 +15,7 @@ class JSONLLogger:
             log_file: Path to JSONL log file
         """
         self.log_file = log_file
+        self._file = None  # Opened on first write, kept open for the run
     
     def _ensure_file_exists(self) -> None:
         """Ensure log file and directory exist."""
@@ -22,6 +23,19 @@ class JSONLLogger:
             # Create directory if needed
             os.makedirs(os.path.dirname(self.log_file), exist_ok=True)
     
+    def _get_file(self) -> TextIO:
+        """Get the append handle for the log file, opening it on first use."""
+        if self._file is None:
+            self._ensure_file_exists()
+            self._file = open(self.log_file, "a")
+        return self._file
+    
+    def close(self) -> None:
+        """Close the log file handle if it is open."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
     def log_test_result(self, timestamp: str, instance_id: str, instance_type: str,
                        instance_passed: bool, domain_stats: Dict[str, Any],
                        ip_mode: str, public_ip: str) -> None:
@@ -56,11 +70,7 @@ class JSONLLogger:
                     "best_ip": stats["best_best_ip"]
                 }
         
-        # Ensure directory exists before writing
-        self._ensure_file_exists()
-        
         # Append to JSONL file
-        with open(self.log_file, "a") as f:
-            json.dump(jsonl_entry, f)
-            f.write("\n")
-            f.flush()  # Ensure data is written to disk
\ No newline at end of file
+        f = self._get_file()
+        f.write(json.dumps(jsonl_entry) + "\n")
+        f.flush()  # Ensure data is written to disk
\ No newline at end of file
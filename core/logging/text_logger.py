@@ -1,9 +1,9 @@
 """Text format logging for the latency finder."""
 
 import os
-from typing import Dict, Any
+from typing import Dict, Any, TextIO
 
-from ..utils import format_domain_short
+from ..utils import format_domain_stats
 
 
 class TextLogger:
@@ -16,6 +16,7 @@ class TextLogger:
             log_file: Path to text log file
         """
         self.log_file = log_file
+        self._file = None  # Opened on first write, kept open for the run
     
     def _ensure_file_exists(self) -> None:
         """Ensure log file and directory exist."""
@@ -23,6 +24,19 @@ class TextLogger:
             # Create directory if needed
             os.makedirs(os.path.dirname(self.log_file), exist_ok=True)
     
+    def _get_file(self) -> TextIO:
+        """Get the append handle for the log file, opening it on first use."""
+        if self._file is None:
+            self._ensure_file_exists()
+            self._file = open(self.log_file, "a")
+        return self._file
+    
+    def close(self) -> None:
+        """Close the log file handle if it is open."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
     def log_test_result(self, timestamp: str, instance_id: str, instance_type: str,
                        instance_passed: bool, domain_stats: Dict[str, Any],
                        results: Dict[str, Any], median_threshold: float,
@@ -41,44 +55,43 @@ class TextLogger:
             ip_mode: IP assignment mode ('eip' or 'auto-assigned')
             public_ip: The public IP address of the instance
         """
-        # Ensure directory exists before writing
-        self._ensure_file_exists()
+        # Build the whole record in memory and write it with one call
+        parts = []
         
-        with open(self.log_file, "a") as f:
-            # Write summary line
-            f.write(f"[{timestamp}] Instance: {instance_id} ({instance_type})\n")
-            f.write(f"IP Mode: {'EIP' if ip_mode == 'eip' else 'Auto-assigned'} ({public_ip})\n")
-            f.write(f"Status: {'PASSED' if instance_passed else 'FAILED'}\n\n")
-            
-            # Write per-domain best results
-            for hostname, stats in domain_stats.items():
-                domain_short = format_domain_short(hostname)
-                f.write(f"  {domain_short}: median={stats['best_median']:.2f}µs "
-                       f"({stats['best_median_ip']}), best={stats['best_best']:.2f}µs "
-                       f"({stats['best_best_ip']})\n")
-            
-            f.write(f"  Passed: {instance_passed}\n")
+        # Write summary line
+        parts.append(f"[{timestamp}] Instance: {instance_id} ({instance_type})\n")
+        parts.append(f"IP Mode: {'EIP' if ip_mode == 'eip' else 'Auto-assigned'} ({public_ip})\n")
+        parts.append(f"Status: {'PASSED' if instance_passed else 'FAILED'}\n\n")
+        
+        # Write per-domain best results
+        for hostname, stats in domain_stats.items():
+            parts.append(f"  {format_domain_stats(hostname, stats)}\n")
+        
+        parts.append(f"  Passed: {instance_passed}\n")
+        
+        # Write detailed test results
+        parts.append("\nLatency test results:\n")
+        for hostname, host_data in results.items():
+            if "error" in host_data:
+                parts.append(f"  {hostname}: {host_data['error']}\n")
+                continue
             
-            # Write detailed test results
-            f.write("\nLatency test results:\n")
-            for hostname, host_data in results.items():
-                if "error" in host_data:
-                    f.write(f"  {hostname}: {host_data['error']}\n")
-                    continue
-                
-                f.write(f"  {hostname}:\n")
-                
-                for ip, ip_data in host_data["ips"].items():
-                    median = ip_data.get("median", float("inf"))
-                    best = ip_data.get("best", float("inf"))
-                    avg = ip_data.get("average", float("inf"))
-                    p1 = ip_data.get("p1", float("inf"))
-                    p99 = ip_data.get("p99", float("inf"))
-                    max_val = ip_data.get("max", float("inf"))
-                    ip_passed = (median <= median_threshold) or (best <= best_threshold)
-                    f.write(f"    IP {ip:<15}  median={median:7.2f}  best={best:7.2f}  "
-                           f"avg={avg:7.2f}  p1={p1:7.2f}  p99={p99:7.2f}  "
-                           f"max={max_val:7.2f} µs  passed={ip_passed}\n")
+            parts.append(f"  {hostname}:\n")
             
-            # Add separator between instances
-            f.write("\n" + "="*80 + "\n\n")
\ No newline at end of file
+            for ip, ip_data in host_data["ips"].items():
+                median = ip_data.get("median", float("inf"))
+                best = ip_data.get("best", float("inf"))
+                avg = ip_data.get("average", float("inf"))
+                p1 = ip_data.get("p1", float("inf"))
+                p99 = ip_data.get("p99", float("inf"))
+                max_val = ip_data.get("max", float("inf"))
+                ip_passed = (median <= median_threshold) or (best <= best_threshold)
+                parts.append(f"    IP {ip:<15}  median={median:7.2f}  best={best:7.2f}  "
+                                 f"avg={avg:7.2f}  p1={p1:7.2f}  p99={p99:7.2f}  "
+                                 f"max={max_val:7.2f} µs  passed={ip_passed}\n")
+        
+        # Add separator between instances
+        parts.append("\n" + "="*80 + "\n\n")
+        f = self._get_file()
+        f.write("".join(parts))
+        f.flush()
\ No newline at end of file
@@ -15,6 +15,7 @@ Features:
 import os
 import json
 import time
+import tempfile
 import subprocess
 from typing import Optional, Dict, Any
 import boto3
@@ -361,8 +362,16 @@ class MonitoringDeployer:
                 'tcp_connection_timeout_ms': self.config.tcp_connection_timeout_ms  # Include TCP timeout
             }, indent=2)
             
-            cmd = f"echo '{config_content}' > {self.monitor_dir}/config.json"
-            self.ssh_client.run_command(instance_ip, cmd)
+            # Transfer the config with SCP too, instead of quoting it into a remote echo
+            fd, temp_config_file = tempfile.mkstemp(suffix=".json")
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    f.write(config_content)
+                if not self._scp_file_to_instance(temp_config_file, f"{self.monitor_dir}/config.json", instance_ip):
+                    print("[ERROR] Failed to transfer monitoring config via SCP")
+                    return False
+            finally:
+                os.unlink(temp_config_file)
             
             # Copy IP list using SCP for better performance and reliability
             ip_list_path = os.path.join(self.config.ip_list_dir, "ip_list_latest.json")
@@ -371,11 +380,12 @@ class MonitoringDeployer:
                 simplified_ip_list = self._create_simplified_ip_list(ip_list_path)
                 
                 if simplified_ip_list:
-                    # Create temporary simplified IP list file
-                    temp_ip_file = "/tmp/ip_list_monitoring.json"
+                    # Create temporary simplified IP list file; a unique name so
+                    # concurrent deployments never read each other's half-written file
+                    fd, temp_ip_file = tempfile.mkstemp(prefix="ip_list_monitoring_", suffix=".json")
                     try:
-                        with open(temp_ip_file, 'w') as f:
-                            json.dump(simplified_ip_list, f, indent=2)
+                        with os.fdopen(fd, 'w') as f:
+                            json.dump(simplified_ip_list, f, separators=(",", ":"))
                         
                         # Use SCP to transfer the file
                         if self._scp_file_to_instance(temp_ip_file, f"{self.monitor_dir}/ip_list_latest.json", instance_ip):
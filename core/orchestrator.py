@@ -2,7 +2,10 @@
 
 import time
 import os
-from typing import Dict, Any
+import random
+import signal
+import threading
+from typing import Dict, Any, Optional
 
 from .config import Config
 from .aws import EC2Manager, PlacementGroupManager, EIPManager
@@ -11,6 +14,10 @@ from .logging import JSONLLogger, TextLogger, DetailedJSONLLogger
 from .utils import get_current_timestamp, get_log_file_paths, get_run_timestamp, ensure_directory_exists
 from .ip_discovery import load_ip_list
 from .monitoring import MonitoringDeployer
+from .constants import (
+    INSTANCE_TYPE_FAILURE_INITIAL, INSTANCE_TYPE_FAILURE_ALPHA, INSTANCE_TYPE_WEIGHT_FLOOR,
+    WORKER_SHUTDOWN_TIMEOUT
+)
 
 
 class Orchestrator:
@@ -24,15 +31,18 @@ class Orchestrator:
         """
         self.config = config
         self.running = True
-        self.instance_index = 0
         self.qualified_instances = []  # List of (instance_id, instance_type, placement_group, eip_allocation_id) tuples
         
-        # Track current instance for cleanup on Ctrl+C
-        self._current_instance_id = None
-        self._current_placement_group = None
-        self._current_eip_allocation_id = None
-        self._current_eip_name = None
-        self._current_eip_associated = False  # Track if EIP is associated with instance
+        # Track in-flight resources for cleanup on Ctrl+C, one record per worker
+        # thread (see _track); guarded by _state_lock with the instance type
+        # failure rates, qualified_instances and the resource name timestamps
+        self._in_flight: Dict[int, Dict[str, Any]] = {}
+        self._type_failure_rate: Dict[str, float] = {
+            instance_type: INSTANCE_TYPE_FAILURE_INITIAL for instance_type in config.instance_types
+        }
+        self._state_lock = threading.Lock()
+        self._log_lock = threading.Lock()
+        self._last_resource_timestamp = 0
         
         # Ensure report directory exists
         ensure_directory_exists(config.report_dir)
@@ -76,6 +86,99 @@ class Orchestrator:
         self.text_logger = TextLogger(text_file)
         self.detailed_jsonl_logger = DetailedJSONLLogger(detailed_jsonl_file)
     
+    def _track(self, **resources: Any) -> None:
+        """Update the calling worker's in-flight resource record.
+        
+        Keys are instance_id, placement_group, eip_allocation_id, eip_name,
+        eip_associated, public_ip and launching (the instance name while
+        RunInstances is in progress); passing None clears a resource once it
+        is handed off.
+        
+        Args:
+            **resources: Resource fields to set
+        """
+        with self._state_lock:
+            record = self._in_flight.setdefault(threading.get_ident(), {
+                "instance_id": None,
+                "placement_group": None,
+                "eip_allocation_id": None,
+                "eip_name": None,
+                "eip_associated": False,
+                "public_ip": None,
+                "launching": None
+            })
+            record.update(resources)
+    
+    def _clear_tracking(self) -> Optional[Dict[str, Any]]:
+        """Forget the calling worker's in-flight resources.
+        
+        Returns:
+            The record that was cleared, or None if there was none
+        """
+        with self._state_lock:
+            return self._in_flight.pop(threading.get_ident(), None)
+    
+    def _abort_if_stopping(self) -> bool:
+        """Clean up the calling worker's resources if shutdown has started.
+        
+        Workers call this between resource steps, so after Ctrl+C each one
+        stops at its next step and releases what it holds itself, rather
+        than _handle_shutdown cleaning up resources a worker is still using.
+        
+        Returns:
+            True if the caller should stop
+        """
+        if self.running:
+            return False
+        record = self._clear_tracking()
+        if record:
+            self._cleanup_in_flight(record)
+            self.ec2_manager.flush_terminations()
+        return True
+    
+    def _next_instance_type(self) -> str:
+        """Pick the next instance type to try (thread-safe).
+        
+        Types are sampled with weight inversely proportional to their recent
+        capacity failure rate, so types AWS currently cannot supply are
+        tried less often without being dropped.
+        """
+        with self._state_lock:
+            weights = [1 / (INSTANCE_TYPE_WEIGHT_FLOOR + self._type_failure_rate[instance_type])
+                       for instance_type in self.config.instance_types]
+            return random.choices(self.config.instance_types, weights=weights)[0]
+    
+    def _record_launch_outcome(self, instance_type: str, capacity_failure: bool) -> None:
+        """Fold a launch outcome into the type's decaying failure rate.
+        
+        Args:
+            instance_type: EC2 instance type that was launched
+            capacity_failure: Whether the launch failed for capacity/limit reasons
+        """
+        with self._state_lock:
+            rate = self._type_failure_rate[instance_type]
+            self._type_failure_rate[instance_type] = (
+                (1 - INSTANCE_TYPE_FAILURE_ALPHA) * rate
+                + INSTANCE_TYPE_FAILURE_ALPHA * float(capacity_failure)
+            )
+    
+    def _next_resource_timestamp(self) -> int:
+        """Get a unique Unix timestamp for naming a candidate's resources.
+        
+        Placement group and EIP names embed the timestamp, so concurrent
+        workers starting within the same second are given successive values.
+        """
+        with self._state_lock:
+            timestamp = max(int(time.time()), self._last_resource_timestamp + 1)
+            self._last_resource_timestamp = timestamp
+            return timestamp
+    
+    def _close_loggers(self) -> None:
+        """Close the log file handles held open for the run."""
+        self.jsonl_logger.close()
+        self.text_logger.close()
+        self.detailed_jsonl_logger.close()
+    
     def _load_ip_list(self) -> None:
         """Load IP list from file with DNS fallback."""
         ip_list_file = os.path.join(self.config.ip_list_dir, "ip_list_latest.json")
@@ -162,40 +265,110 @@ class Orchestrator:
         # Load initial IP list from file
         self._load_ip_list()
         
+        # Treat SIGTERM (systemd stop, instance shutdown) like Ctrl+C so it
+        # gets the same cleanup instead of killing the process outright
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+        
         try:
-            while self.running:
-                self._run_iteration()
+            workers = self.config.concurrent_instances
+            if workers > 1:
+                self._run_workers(workers)
+            else:
+                while self.running:
+                    self._run_iteration()
         except KeyboardInterrupt:
             self._handle_shutdown()
+        finally:
+            self.ec2_manager.flush_terminations()
+            self._close_loggers()
         
         self._show_final_summary()
     
+    def _run_workers(self, workers: int) -> None:
+        """Test several candidate instances in parallel.
+        
+        Each worker thread runs the same iteration loop as the serial path.
+        The main thread only waits, so Ctrl+C is still delivered to it. It
+        then stops the workers and joins them, giving each up to
+        WORKER_SHUTDOWN_TIMEOUT seconds to reach its next step and clean up
+        after itself, before _handle_shutdown() cleans up whatever is left.
+        
+        Args:
+            workers: Number of worker threads
+        """
+        print(f"[INFO] Testing up to {workers} instances concurrently")
+        
+        def worker():
+            while self.running:
+                self._run_worker_iteration()
+        
+        threads = [threading.Thread(target=worker, daemon=True, name=f"candidate-{i + 1}")
+                   for i in range(workers)]
+        for thread in threads:
+            thread.start()
+        
+        try:
+            while any(thread.is_alive() for thread in threads):
+                # Short timeout keeps the main thread responsive to Ctrl+C
+                threads[0].join(timeout=1)
+        except KeyboardInterrupt:
+            self.running = False
+            print("\n[CTRL-C] Stopping workers after their current step...")
+            deadline = time.monotonic() + WORKER_SHUTDOWN_TIMEOUT
+            for thread in threads:
+                thread.join(timeout=max(0, deadline - time.monotonic()))
+            stuck = sum(1 for thread in threads if thread.is_alive())
+            if stuck:
+                print(f"[WARN] {stuck} worker(s) still busy after {WORKER_SHUTDOWN_TIMEOUT}s, "
+                      f"cleaning up their resources now")
+            raise
+    
+    def _run_worker_iteration(self) -> None:
+        """Run one iteration in a worker thread, surviving unexpected errors.
+        
+        An iteration that raises (e.g. a botocore connection error) may leave
+        an instance, EIP or placement group behind; those are cleaned up here
+        and the record is dropped, so the next iteration starts a fresh one
+        instead of mixing its resources into the failed iteration's record.
+        """
+        try:
+            self._run_iteration()
+        except Exception as e:
+            print(f"[ERROR] Worker iteration failed: {e}")
+            record = self._clear_tracking()
+            if record:
+                self._cleanup_in_flight(record)
+                self.ec2_manager.flush_terminations()
+            time.sleep(5)
+    
     def _run_iteration(self) -> None:
         """Run a single iteration of the main loop."""
         
         # Select instance type
-        instance_type = self.config.instance_types[self.instance_index]
-        self.instance_index = (self.instance_index + 1) % len(self.config.instance_types)
+        instance_type = self._next_instance_type()
         
         # Create placement group
-        unix_timestamp = int(time.time())
+        unix_timestamp = self._next_resource_timestamp()
         placement_group_name = self.pg_manager.generate_placement_group_name(unix_timestamp)
         
         # Track placement group for cleanup
-        self._current_placement_group = placement_group_name
+        self._track(placement_group=placement_group_name)
         
         print(f"\nCreating placement group {placement_group_name}...")
         if not self.pg_manager.create_placement_group(placement_group_name):
-            self._current_placement_group = None
+            self._clear_tracking()
             time.sleep(5)
             return
         
+        if self._abort_if_stopping():
+            return
+        
         # Allocate EIP if needed
         eip_allocation_id = None
         eip_name = None
         if self.config.use_eip:
             eip_name = self.eip_manager.generate_eip_name(unix_timestamp)
-            self._current_eip_name = eip_name
+            self._track(eip_name=eip_name)
             
             print(f"Allocating EIP {eip_name}...")
             eip_allocation_id, eip_public_ip, eip_error = self.eip_manager.allocate_eip(eip_name)
@@ -204,52 +377,57 @@ class Orchestrator:
                 print(f"[ERROR] EIP allocation failed: {eip_error}")
                 print(f"Deleting placement group {placement_group_name}...")
                 self.pg_manager.delete_placement_group(placement_group_name)
-                self._current_placement_group = None
-                self._current_eip_name = None
+                self._clear_tracking()
                 time.sleep(5)
                 return
             
             # Track EIP for cleanup
-            self._current_eip_allocation_id = eip_allocation_id
+            self._track(eip_allocation_id=eip_allocation_id)
+            
+            if self._abort_if_stopping():
+                return
         
         # Launch instance
         instance_name = f"Search_{unix_timestamp}_{int(self.config.median_threshold_us)}/{int(self.config.best_threshold_us)}"
         print(f"Launching test instance of type {instance_type} ...")
         
+        self._track(launching=instance_name)
         instance_id, error = self.ec2_manager.launch_instance(
             instance_type, placement_group_name, instance_name
         )
         
         if not instance_id:
-            self._handle_launch_error(error, placement_group_name, eip_allocation_id, eip_name)
-            self._current_placement_group = None
-            self._current_eip_allocation_id = None
-            self._current_eip_name = None
-            self._current_eip_associated = False
+            self._handle_launch_error(error, instance_type, placement_group_name, eip_allocation_id, eip_name)
+            self._clear_tracking()
             return
         
+        self._record_launch_outcome(instance_type, capacity_failure=False)
+        
         # Track instance for cleanup
-        self._current_instance_id = instance_id
+        self._track(instance_id=instance_id, launching=None)
         print(f"[OK] Instance {instance_id} launched.")
         
+        if self._abort_if_stopping():
+            return
+        
         # Process the instance
         success = self._process_instance(
             instance_id, instance_type, placement_group_name, eip_allocation_id, eip_name
         )
         
         # Clear tracking after processing
-        self._current_instance_id = None
-        self._current_placement_group = None
-        self._current_eip_allocation_id = None
-        self._current_eip_name = None
-        self._current_eip_associated = False
+        record = self._clear_tracking()
+        
+        # Done with this host: close its multiplexed SSH connection
+        if record and record["public_ip"]:
+            self.ssh_client.close_master(record["public_ip"])
         
         if not success:
             # Instance failed somewhere in processing
             return
         
     
-    def _handle_launch_error(self, error: str, placement_group_name: str, 
+    def _handle_launch_error(self, error: str, instance_type: str, placement_group_name: str, 
                            eip_allocation_id: str, eip_name: str) -> None:
         """Handle instance launch error."""
         print(f"[ERROR] run_instances failed: {error}")
@@ -266,11 +444,29 @@ class Orchestrator:
         # Check if it's a capacity error
         if self.ec2_manager.is_capacity_error(error):
             print(" -> Capacity/limit issue, will try next instance type.")
-            self.instance_index = (self.instance_index + 1) % len(self.config.instance_types)
+            self._record_launch_outcome(instance_type, capacity_failure=True)
             time.sleep(2)
         else:
             time.sleep(5)
     
+    def _teardown_instance(self, instance_id: str, placement_group_name: str,
+                           eip_allocation_id: str, eip_name: str) -> None:
+        """Terminate a candidate instance and schedule cleanup of its resources.
+        
+        Shared by every path that gives up on an instance, so none of them can
+        forget the placement group or the EIP.
+        
+        Args:
+            instance_id: EC2 instance ID
+            placement_group_name: Placement group name
+            eip_allocation_id: EIP allocation ID (None in auto-assigned IP mode)
+            eip_name: EIP name for logging
+        """
+        self.ec2_manager.queue_termination(instance_id)
+        self.pg_manager.schedule_async_cleanup(instance_id, placement_group_name)
+        if self.config.use_eip and eip_allocation_id:
+            self.eip_manager.schedule_async_eip_cleanup(instance_id, eip_allocation_id, eip_name)
+    
     def _process_instance(self, instance_id: str, instance_type: str, 
                          placement_group_name: str, eip_allocation_id: str, eip_name: str) -> bool:
         """Process a launched instance through all steps.
@@ -279,12 +475,13 @@ class Orchestrator:
             True if processing completed successfully
         """
         # Wait for instance to be running
-        if not self.ec2_manager.wait_for_running(instance_id):
+        is_running, running_public_ip = self.ec2_manager.wait_for_running(instance_id)
+        if not is_running:
             print("[WARN] Instance not running within timeout, terminating...")
-            self.ec2_manager.terminate_instance(instance_id)
-            self.pg_manager.schedule_async_cleanup(instance_id, placement_group_name)
-            if self.config.use_eip and eip_allocation_id:
-                self.eip_manager.schedule_async_eip_cleanup(instance_id, eip_allocation_id, eip_name)
+            self._teardown_instance(instance_id, placement_group_name, eip_allocation_id, eip_name)
+            return False
+        
+        if self._abort_if_stopping():
             return False
         
         # Get public IP - either from EIP or auto-assigned
@@ -293,52 +490,47 @@ class Orchestrator:
             print(f"Associating EIP with instance...")
             if not self.eip_manager.associate_eip(eip_allocation_id, instance_id):
                 print("[ERROR] Failed to associate EIP with instance. Terminating...")
-                self.ec2_manager.terminate_instance(instance_id)
-                self.pg_manager.schedule_async_cleanup(instance_id, placement_group_name)
-                self.eip_manager.schedule_async_eip_cleanup(instance_id, eip_allocation_id, eip_name)
-                time.sleep(2)
+                self._teardown_instance(instance_id, placement_group_name, eip_allocation_id, eip_name)
                 return False
             
             # Mark EIP as associated
-            self._current_eip_associated = True
+            self._track(eip_associated=True)
             
             # Get EIP public IP for testing
             public_ip = self.eip_manager.get_eip_public_ip(eip_allocation_id)
             if not public_ip:
                 print("[ERROR] Could not get EIP public IP. Terminating...")
-                self.ec2_manager.terminate_instance(instance_id)
-                self.pg_manager.schedule_async_cleanup(instance_id, placement_group_name)
-                self.eip_manager.schedule_async_eip_cleanup(instance_id, eip_allocation_id, eip_name)
-                time.sleep(2)
+                self._teardown_instance(instance_id, placement_group_name, eip_allocation_id, eip_name)
                 return False
             
             print(f"[OK] Instance has EIP: {public_ip}")
         else:
             # Get auto-assigned public IP
             print(f"Getting auto-assigned public IP...")
-            # Wait a moment for AWS to assign the public IP
-            time.sleep(5)
-            public_ip = self.ec2_manager.get_instance_public_ip(instance_id)
+            # Usually already in the describe response that reported "running"
+            public_ip = running_public_ip
+            if not public_ip:
+                # Wait a moment for AWS to assign the public IP
+                time.sleep(5)
+                public_ip = self.ec2_manager.get_instance_public_ip(instance_id)
             if not public_ip:
                 print("[ERROR] Instance has no auto-assigned public IP. Terminating...")
                 print("       Check subnet auto-assign public IP setting")
-                self.ec2_manager.terminate_instance(instance_id)
-                self.pg_manager.schedule_async_cleanup(instance_id, placement_group_name)
-                time.sleep(2)
+                self._teardown_instance(instance_id, placement_group_name, eip_allocation_id, eip_name)
                 return False
             
             print(f"[OK] Instance has auto-assigned IP: {public_ip}")
         
         test_ip = public_ip
+        self._track(public_ip=public_ip)
+        
+        if self._abort_if_stopping():
+            return False
         
         # Wait for SSH
         if not self.ssh_client.wait_for_ssh(test_ip):
             print("[ERROR] SSH not available after timeout. Terminating instance...")
-            self.ec2_manager.terminate_instance(instance_id)
-            self.pg_manager.schedule_async_cleanup(instance_id, placement_group_name)
-            if self.config.use_eip and eip_allocation_id:
-                self.eip_manager.schedule_async_eip_cleanup(instance_id, eip_allocation_id, eip_name)
-            time.sleep(2)
+            self._teardown_instance(instance_id, placement_group_name, eip_allocation_id, eip_name)
             return False
         
         # Wait for instance to be ready for testing
@@ -352,6 +544,9 @@ class Orchestrator:
             ec2_manager=self.ec2_manager
         )
         
+        if self._abort_if_stopping():
+            return False
+        
         # Refresh IP list to get latest IPs from discover_ips.py
         print(f"Refreshing IP list before testing...")
         self._refresh_ip_list(show_changes=False)
@@ -359,11 +554,11 @@ class Orchestrator:
         # Run latency test with refreshed IP list
         results = self.latency_runner.run_latency_test(test_ip, ip_list=self.ip_list)
         if not results:
-            self.ec2_manager.terminate_instance(instance_id)
-            self.pg_manager.schedule_async_cleanup(instance_id, placement_group_name)
-            if self.config.use_eip and eip_allocation_id:
-                self.eip_manager.schedule_async_eip_cleanup(instance_id, eip_allocation_id, eip_name)
-            time.sleep(2)
+            self._teardown_instance(instance_id, placement_group_name, eip_allocation_id, eip_name)
+            return False
+        
+        # Stopping: the instance is not logged or qualified, just cleaned up
+        if self._abort_if_stopping():
             return False
         
         # Process results
@@ -382,21 +577,22 @@ class Orchestrator:
         # Determine IP mode for logging
         ip_mode = "eip" if self.config.use_eip else "auto-assigned"
         
-        # Write logs
-        self.jsonl_logger.log_test_result(
-            timestamp, instance_id, instance_type, instance_passed, domain_stats,
-            ip_mode, test_ip
-        )
-        self.text_logger.log_test_result(
-            timestamp, instance_id, instance_type, instance_passed, domain_stats,
-            results, self.config.median_threshold_us, self.config.best_threshold_us,
-            ip_mode, test_ip
-        )
-        self.detailed_jsonl_logger.log_test_result(
-            timestamp, instance_id, instance_type, instance_passed, results,
-            self.config.median_threshold_us, self.config.best_threshold_us,
-            ip_mode, test_ip
-        )
+        # Write logs (serialized so concurrent workers never interleave records)
+        with self._log_lock:
+            self.jsonl_logger.log_test_result(
+                timestamp, instance_id, instance_type, instance_passed, domain_stats,
+                ip_mode, test_ip
+            )
+            self.text_logger.log_test_result(
+                timestamp, instance_id, instance_type, instance_passed, domain_stats,
+                results, self.config.median_threshold_us, self.config.best_threshold_us,
+                ip_mode, test_ip
+            )
+            self.detailed_jsonl_logger.log_test_result(
+                timestamp, instance_id, instance_type, instance_passed, results,
+                self.config.median_threshold_us, self.config.best_threshold_us,
+                ip_mode, test_ip
+            )
         
         # Check if this is a qualified instance
         if instance_passed:
@@ -413,7 +609,8 @@ class Orchestrator:
                                    domain_stats: Dict[str, Any]) -> None:
         """Handle finding a qualified instance."""
         # Track this qualified instance (including EIP)
-        self.qualified_instances.append((instance_id, instance_type, placement_group_name, eip_allocation_id))
+        with self._state_lock:
+            self.qualified_instances.append((instance_id, instance_type, placement_group_name, eip_allocation_id))
         
         # Update instance name to reflect it's qualified with criteria
         timestamp = int(time.time())
@@ -452,83 +649,114 @@ class Orchestrator:
         print(f"Instance {instance_id} did not meet latency target. "
               f"Terminating and continuing...")
         
-        if self.ec2_manager.terminate_instance(instance_id):
-            print("  [OK] Instance termination initiated")
-        
-        # Schedule placement group deletion
-        print(f"Scheduling placement group {placement_group_name} for deletion...")
-        self.pg_manager.schedule_async_cleanup(instance_id, placement_group_name)
-        
-        # Schedule EIP release if using EIP
+        print(f"Queueing termination and scheduling placement group {placement_group_name} for deletion...")
         if self.config.use_eip and eip_allocation_id:
             print(f"Scheduling EIP {eip_name} for release...")
-            self.eip_manager.schedule_async_eip_cleanup(instance_id, eip_allocation_id, eip_name)
-        
-        time.sleep(2)
+        self._teardown_instance(instance_id, placement_group_name, eip_allocation_id, eip_name)
     
     
     def _handle_shutdown(self) -> None:
         """Handle graceful shutdown on Ctrl+C."""
         print("\n[CTRL-C] Graceful shutdown requested...")
+        self.running = False
+        
+        # Clean up what every worker had in flight
+        with self._state_lock:
+            records = list(self._in_flight.values())
+            self._in_flight.clear()
+        for record in records:
+            self._cleanup_in_flight(record)
+        
+        # Terminate everything still queued in one call
+        self.ec2_manager.flush_terminations()
+        
+        # Wait for cleanup threads
+        self.pg_manager.wait_for_cleanup_threads()
+        self.eip_manager.wait_for_cleanup_threads()
+    
+    def _cleanup_in_flight(self, record: Dict[str, Any]) -> None:
+        """Clean up one worker's in-flight resources on shutdown.
+        
+        Args:
+            record: In-flight resource record (see _track)
+        """
+        instance_id = record["instance_id"]
+        placement_group = record["placement_group"]
+        eip_allocation_id = record["eip_allocation_id"]
+        eip_name = record["eip_name"]
+        
+        if record["public_ip"]:
+            self.ssh_client.close_master(record["public_ip"])
         
         # Check if we have a current instance to handle
-        if self._current_instance_id:
+        if instance_id:
             # Check if current instance is a qualified instance
-            is_qualified = any(instance_id == self._current_instance_id for instance_id, _, _, _ in self.qualified_instances)
+            is_qualified = any(qualified_id == instance_id for qualified_id, _, _, _ in self.qualified_instances)
             if is_qualified:
-                print(f"-> Preserving qualified instance {self._current_instance_id}")
+                print(f"-> Preserving qualified instance {instance_id}")
             else:
-                print(f"-> Terminating pending instance {self._current_instance_id} ...")
-                self.ec2_manager.terminate_instance(self._current_instance_id)
+                print(f"-> Terminating pending instance {instance_id} ...")
+                self.ec2_manager.queue_termination(instance_id)
                 # Schedule placement group cleanup if exists
-                if self._current_placement_group:
-                    print(f"-> Scheduling cleanup of placement group {self._current_placement_group} ...")
-                    self.pg_manager.schedule_async_cleanup(self._current_instance_id, self._current_placement_group)
+                if placement_group:
+                    print(f"-> Scheduling cleanup of placement group {placement_group} ...")
+                    self.pg_manager.schedule_async_cleanup(instance_id, placement_group)
                 # Handle EIP cleanup based on association status
-                if self._current_eip_allocation_id and self._current_eip_name:
-                    if self._current_eip_associated:
+                if eip_allocation_id and eip_name:
+                    if record["eip_associated"]:
                         # EIP is associated with instance, schedule async cleanup
-                        print(f"-> Scheduling cleanup of EIP {self._current_eip_name} (associated with instance)...")
-                        self.eip_manager.schedule_async_eip_cleanup(self._current_instance_id, self._current_eip_allocation_id, self._current_eip_name)
+                        print(f"-> Scheduling cleanup of EIP {eip_name} (associated with instance)...")
+                        self.eip_manager.schedule_async_eip_cleanup(instance_id, eip_allocation_id, eip_name)
                     else:
                         # EIP was allocated but never associated, release immediately
-                        print(f"-> Releasing unassociated EIP {self._current_eip_name} immediately...")
-                        self.eip_manager.release_eip(self._current_eip_allocation_id)
+                        print(f"-> Releasing unassociated EIP {eip_name} immediately...")
+                        self.eip_manager.release_eip(eip_allocation_id)
+        elif record["launching"]:
+            # RunInstances may still place an instance in these resources, so
+            # deleting them now could fail or strand it; leave them to the user
+            print(f"[WARN] Instance {record['launching']} was still launching; "
+                  f"check for it in the EC2 console and clean up")
+            if placement_group:
+                print(f"       placement group {placement_group}")
+            if eip_allocation_id and eip_name:
+                print(f"       EIP {eip_name}")
         else:
             # No instance but resources may exist - clean up directly
-            if self._current_placement_group:
-                print(f"-> Deleting unused placement group {self._current_placement_group} ...")
-                self.pg_manager.delete_placement_group(self._current_placement_group)
-            if self._current_eip_allocation_id and self._current_eip_name:
-                print(f"-> Releasing unused EIP {self._current_eip_name} ...")
-                self.eip_manager.release_eip(self._current_eip_allocation_id)
-        
-        # Wait for cleanup threads
-        self.pg_manager.wait_for_cleanup_threads()
-        self.eip_manager.wait_for_cleanup_threads()
+            if placement_group:
+                print(f"-> Deleting unused placement group {placement_group} ...")
+                self.pg_manager.delete_placement_group(placement_group)
+            if eip_allocation_id and eip_name:
+                print(f"-> Releasing unused EIP {eip_name} ...")
+                self.eip_manager.release_eip(eip_allocation_id)
     
     def _show_final_summary(self) -> None:
         """Show final summary after loop ends."""
+        # Collect the whole summary and print it at once so it stays one block
+        lines = []
         if self.qualified_instances:
-            print(f"\nFound {len(self.qualified_instances)} qualified instance(s):")
+            lines.append(f"\nFound {len(self.qualified_instances)} qualified instance(s):")
+            # One DescribeInstances call for all current auto-assigned IPs
+            auto_ip_ids = [instance_id for instance_id, _, _, eip_allocation_id in self.qualified_instances
+                           if not (self.config.use_eip and eip_allocation_id)]
+            instance_info = self.ec2_manager.describe_instances(auto_ip_ids) if auto_ip_ids else {}
             for i, (instance_id, instance_type, placement_group, eip_allocation_id) in enumerate(self.qualified_instances, 1):
-                print(f"  {i}. {instance_id} ({instance_type}) in {placement_group}")
+                lines.append(f"  {i}. {instance_id} ({instance_type}) in {placement_group}")
                 if self.config.use_eip and eip_allocation_id:
                     eip_public_ip = self.eip_manager.get_eip_public_ip(eip_allocation_id)
-                    print(f"     EIP: {eip_public_ip} ({eip_allocation_id})")
+                    lines.append(f"     EIP: {eip_public_ip} ({eip_allocation_id})")
                 else:
                     # Get current auto-assigned IP
-                    auto_ip = self.ec2_manager.get_instance_public_ip(instance_id)
-                    print(f"     Auto-assigned IP: {auto_ip}")
-            print("\nKeep these instances running for production use.")
-            print("Stop protection has been enabled on all qualified instances.")
+                    auto_ip = instance_info.get(instance_id, {}).get('public_ip')
+                    lines.append(f"     Auto-assigned IP: {auto_ip}")
+            lines.append("\nKeep these instances running for production use.")
+            lines.append("Stop protection has been enabled on all qualified instances.")
             if self.config.use_eip:
-                print("Both placement groups and EIPs are preserved for qualified instances.")
+                lines.append("Both placement groups and EIPs are preserved for qualified instances.")
             else:
-                print("Placement groups are preserved for qualified instances.")
-                print("Note: Auto-assigned IPs may change if instances are stopped/started.")
+                lines.append("Placement groups are preserved for qualified instances.")
+                lines.append("Note: Auto-assigned IPs may change if instances are stopped/started.")
         else:
-            print("Search stopped without finding any qualified instances.")
+            lines.append("Search stopped without finding any qualified instances.")
         
         # Show cleanup thread status
         pg_active_count = self.pg_manager.get_active_cleanup_count()
@@ -536,11 +764,12 @@ class Orchestrator:
         total_active = pg_active_count + eip_active_count
         
         if total_active > 0:
-            print(f"\n{total_active} background cleanup task(s) still running...")
+            lines.append(f"\n{total_active} background cleanup task(s) still running...")
             if pg_active_count > 0:
-                print(f"  - {pg_active_count} placement group cleanup task(s)")
+                lines.append(f"  - {pg_active_count} placement group cleanup task(s)")
             if eip_active_count > 0:
-                print(f"  - {eip_active_count} EIP cleanup task(s)")
-            print("These will check instance status every 10 seconds for up to 30 minutes.")
-            print("Resources will be cleaned up automatically when instances terminate.")
-        time.sleep(2)
\ No newline at end of file
+                lines.append(f"  - {eip_active_count} EIP cleanup task(s)")
+            lines.append("These will check instance status every 10-60 seconds (backing off while nothing changes) for up to 30 minutes.")
+            lines.append("Resources will be cleaned up automatically when instances terminate.")
+        
+        print("\n".join(lines))
\ No newline at end of file
@@ -9,7 +9,7 @@ Note: This is an internal script. Use test_instance_latency.py for user-facing
 latency testing with beautiful formatted output.
 """
 
-import socket, statistics, time, sys, json, argparse, os
+import socket, struct, time, sys, json, argparse, os, errno
 from datetime import datetime
 
 ATTEMPTS = 1000
@@ -40,24 +40,44 @@ def load_config_domains():
         log_progress(f"WARNING: Failed to load config.json: {e}")
         return []
 
+def connect_error_message(err):
+    """Describe a connect_ex() errno the way socket.error would have."""
+    if err == errno.EWOULDBLOCK:
+        # connect_ex() reports an expired socket timeout as EWOULDBLOCK
+        return "timed out"
+    return f"[Errno {err}] {os.strerror(err)}"
+
 def test_latency(ip, hostname, timeout_seconds):
+    # Hoist lookups out of the probe loops; the with-blocks close the socket
+    # on failed connects too, so timeouts do not leak descriptors
+    new_socket = socket.socket
+    af_inet, sock_stream = socket.AF_INET, socket.SOCK_STREAM
+    # SO_LINGER with a zero timeout makes close() send RST instead of FIN, so
+    # the thousands of probe connections do not pile up in TIME_WAIT
+    sol_socket, so_linger = socket.SOL_SOCKET, socket.SO_LINGER
+    linger_rst = struct.pack('ii', 1, 0)
+    perf_counter_ns = time.perf_counter_ns
+    address = (ip, 443)
+    
     # Warmup phase - establish connections but don't record timings
     warmup_success = 0
     warmup_errors = {}
     for i in range(WARMUP_ATTEMPTS):
         try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.settimeout(timeout_seconds)
-            s.connect((ip, 443))
-            s.close()
-            warmup_success += 1
+            with new_socket(af_inet, sock_stream) as s:
+                s.setsockopt(sol_socket, so_linger, linger_rst)
+                s.settimeout(timeout_seconds)
+                err = s.connect_ex(address)
         except socket.error as e:
-            error_msg = str(e)
-            warmup_errors[error_msg] = warmup_errors.get(error_msg, 0) + 1
-            continue
+            err = str(e)
+        if err == 0:
+            warmup_success += 1
+        else:
+            warmup_errors[err] = warmup_errors.get(err, 0) + 1
     
     if warmup_errors:
-        for error_msg, count in warmup_errors.items():
+        for err, count in warmup_errors.items():
+            error_msg = err if isinstance(err, str) else connect_error_message(err)
             log_progress(f"    WARMUP: {count} failures with error: {error_msg}")
     
     if warmup_success == 0:
@@ -71,25 +91,31 @@ def test_latency(ip, hostname, timeout_seconds):
             "max": float("inf")
         }
     
-    # Actual measurement phase
-    latencies = []
+    # Actual measurement phase. connect_ex() reports failures as an errno
+    # instead of raising, and samples go into a preallocated list
+    latencies = [0] * ATTEMPTS
+    samples = 0
     test_errors = {}
     for i in range(ATTEMPTS):
         try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.settimeout(timeout_seconds)
-            t0 = time.perf_counter_ns()
-            s.connect((ip, 443))
-            t1 = time.perf_counter_ns()
-            s.close()
-            latencies.append((t1 - t0) / 1000)  # ns to microseconds
+            with new_socket(af_inet, sock_stream) as s:
+                s.setsockopt(sol_socket, so_linger, linger_rst)
+                s.settimeout(timeout_seconds)
+                t0 = perf_counter_ns()
+                err = s.connect_ex(address)
+                t1 = perf_counter_ns()
         except socket.error as e:
-            error_msg = str(e)
-            test_errors[error_msg] = test_errors.get(error_msg, 0) + 1
-            continue
+            err = str(e)
+        if err == 0:
+            latencies[samples] = t1 - t0  # integer nanoseconds; converted once below
+            samples += 1
+        else:
+            test_errors[err] = test_errors.get(err, 0) + 1
+    del latencies[samples:]
     
     if test_errors:
-        for error_msg, count in test_errors.items():
+        for err, count in test_errors.items():
+            error_msg = err if isinstance(err, str) else connect_error_message(err)
             log_progress(f"    TEST: {count} failures with error: {error_msg}")
     
     if not latencies:
@@ -106,9 +132,16 @@ def test_latency(ip, hostname, timeout_seconds):
     success_rate = len(latencies) / ATTEMPTS * 100
     log_progress(f"    Success rate: {success_rate:.1f}% ({len(latencies)}/{ATTEMPTS} connections)")
     
-    # Calculate all statistics
-    sorted_latencies = sorted(latencies)
+    # Calculate all statistics on the integer nanosecond samples; the list is
+    # sorted once and the median is read by index rather than via statistics
+    latencies.sort()
+    sorted_latencies = latencies
     n = len(sorted_latencies)
+    mid = n // 2
+    if n % 2:
+        median_ns = sorted_latencies[mid]
+    else:
+        median_ns = (sorted_latencies[mid - 1] + sorted_latencies[mid]) / 2
     
     # Calculate percentiles
     p1_index = int(n * 0.01)
@@ -116,13 +149,14 @@ def test_latency(ip, hostname, timeout_seconds):
     if p99_index >= n:
         p99_index = n - 1
     
+    # Convert ns to microseconds once per statistic instead of per sample
     stats = {
-        "median": statistics.median(sorted_latencies),
-        "best": sorted_latencies[0],  # min
-        "average": statistics.mean(sorted_latencies),
-        "p1": sorted_latencies[p1_index],
-        "p99": sorted_latencies[p99_index],
-        "max": sorted_latencies[-1]  # max
+        "median": median_ns / 1000,
+        "best": sorted_latencies[0] / 1000,  # min
+        "average": sum(sorted_latencies) / n / 1000,
+        "p1": sorted_latencies[p1_index] / 1000,
+        "p99": sorted_latencies[p99_index] / 1000,
+        "max": sorted_latencies[-1] / 1000  # max
     }
     
     return stats
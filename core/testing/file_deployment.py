@@ -49,7 +49,7 @@ class TempFileManager:
         Returns:
             Path to created temporary JSON file
         """
-        content = json.dumps(data, indent=2)
+        content = json.dumps(data, separators=(",", ":"))
         return self.create_temp_file(content, suffix='.json', prefix=prefix)
     
     def cleanup(self) -> None:
@@ -124,7 +124,8 @@ class FileDeployer:
         Returns:
             True if successful, False otherwise
         """
-        content = json.dumps(data, indent=2)
+        # Compact separators: only ever read by the remote scripts
+        content = json.dumps(data, separators=(",", ":"))
         return self.deploy_content_as_file(ip, content, remote_path, suffix='.json', prefix='json_')
     
     def deploy_script_file(self, ip: str, script_content: str, remote_path: str) -> bool:
@@ -140,6 +141,19 @@ class FileDeployer:
         """
         return self.deploy_content_as_file(ip, script_content, remote_path, suffix='.py', prefix='script_')
     
+    def deploy_local_file(self, ip: str, local_path: str, remote_path: str) -> bool:
+        """Deploy an existing local file to remote instance as-is.
+        
+        Args:
+            ip: Target IP address
+            local_path: Local file path
+            remote_path: Remote file path
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        return self.ssh_client.copy_file(ip, local_path, remote_path)
+    
     def deploy_ip_list(self, ip: str, ip_list: Dict[str, List[str]], 
                       remote_path: str = "/tmp/ip_list.json") -> bool:
         """Deploy IP list to remote instance.
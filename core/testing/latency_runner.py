@@ -7,6 +7,35 @@ from typing import Dict, Any, Optional
 from .ssh_client import SSHClient
 from .file_deployment import create_file_deployer
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def parse_results(stdout: str) -> Dict[str, Any]:
+    """Parse the JSON printed by the remote latency test script.
+    
+    Uses orjson when available. The script reports failed IPs as Infinity,
+    which orjson rejects, so such output falls back to the stdlib parser.
+    
+    Args:
+        stdout: Test script stdout
+        
+    Returns:
+        Parsed results dict
+        
+    Raises:
+        json.JSONDecodeError: If stdout is not valid JSON
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(stdout)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(stdout)
+
 
 class LatencyTestRunner:
     """Runs latency tests on EC2 instances."""
@@ -20,7 +49,7 @@ class LatencyTestRunner:
             tcp_timeout_ms: TCP connection timeout in milliseconds for each connection
         """
         self.ssh_client = ssh_client
-        self._test_script = None
+        self._test_script_path = None
         self.domains = domains or []
         self.tcp_timeout_ms = tcp_timeout_ms
         # Use large SSH timeout as safety net (30 minutes)
@@ -30,14 +59,21 @@ class LatencyTestRunner:
         self.file_deployer = create_file_deployer(ssh_client.key_path)
     
     def load_test_script(self, script_path: str = "binance_latency_test.py") -> None:
-        """Load the latency test script from core/testing directory.
+        """Locate the latency test script in the core/testing directory.
+        
+        The script file is copied to each instance unchanged, so it is never
+        read or re-encoded here.
         
         Args:
             script_path: Path to test script file (relative to this module)
+            
+        Raises:
+            FileNotFoundError: If the script does not exist
         """
         full_path = os.path.join(os.path.dirname(__file__), script_path)
-        with open(full_path, "r") as f:
-            self._test_script = f.read()
+        if not os.path.isfile(full_path):
+            raise FileNotFoundError(f"Latency test script not found: {full_path}")
+        self._test_script_path = full_path
     
     def run_latency_test(self, public_ip: str, ip_list: Optional[Dict[str, list]] = None) -> Optional[Dict[str, Any]]:
         """Run latency test on instance and return results.
@@ -49,14 +85,14 @@ class LatencyTestRunner:
         Returns:
             Test results dict or None on failure
         """
-        if not self._test_script:
+        if not self._test_script_path:
             print("[ERROR] Test script not loaded")
             return None
         
         print("Running latency test via SSH...")
         
         # Deploy test script using reliable SCP-based method
-        if not self.file_deployer.deploy_script_file(public_ip, self._test_script, "/tmp/latency_test.py"):
+        if not self.file_deployer.deploy_local_file(public_ip, self._test_script_path, "/tmp/latency_test.py"):
             print("[ERROR] Failed to deploy test script via SCP")
             return None
         
@@ -106,7 +142,7 @@ class LatencyTestRunner:
             # Try to parse partial results from stdout if available
             if stdout:
                 try:
-                    results = json.loads(stdout)
+                    results = parse_results(stdout)
                     print("[INFO] Partial results were obtained despite the error")
                     return results
                 except json.JSONDecodeError:
@@ -116,7 +152,7 @@ class LatencyTestRunner:
         
         # Parse JSON results
         try:
-            results = json.loads(stdout)
+            results = parse_results(stdout)
             return results
         except json.JSONDecodeError as e:
             print(f"[ERROR] Failed to parse test results: {e}")
@@ -1,8 +1,9 @@
 """Process and analyze latency test results."""
 
+from operator import itemgetter
 from typing import Dict, Any, Tuple
 
-from ..utils import format_domain_short
+from ..utils import format_domain_stats
 
 
 class ResultProcessor:
@@ -29,40 +30,34 @@ class ResultProcessor:
         """
         domain_stats = {}
         instance_passed = False
+        no_ip = ("", float("inf"), float("inf"))
         
         for hostname, host_data in results.items():
             if "error" in host_data:
                 continue
             
-            # Initialize domain tracking
+            # Flatten once to (ip, median, best) rows
+            rows = [
+                (ip, ip_data.get("median", float("inf")), ip_data.get("best", float("inf")))
+                for ip, ip_data in host_data["ips"].items()
+            ]
+            
+            # Best median and best "best" for this domain (first IP wins ties)
+            best_median_ip, best_median, _ = min(rows, key=itemgetter(1), default=no_ip)
+            best_best_ip, _, best_best = min(rows, key=itemgetter(2), default=no_ip)
+            
             domain_stats[hostname] = {
-                "best_median": float("inf"),
-                "best_best": float("inf"),
-                "best_median_ip": "",
-                "best_best_ip": ""
+                "best_median": best_median,
+                "best_best": best_best,
+                # IPs that never connected (inf) are not reported as best
+                "best_median_ip": best_median_ip if best_median < float("inf") else "",
+                "best_best_ip": best_best_ip if best_best < float("inf") else ""
             }
             
-            # Process each IP
-            for ip, ip_data in host_data["ips"].items():
-                median = ip_data.get("median", float("inf"))
-                best = ip_data.get("best", float("inf"))
-                
-                # Check if this IP meets criteria
-                ip_passed = (median <= self.median_threshold) or (best <= self.best_threshold)
-                
-                # Track best median for this domain
-                if median < domain_stats[hostname]["best_median"]:
-                    domain_stats[hostname]["best_median"] = median
-                    domain_stats[hostname]["best_median_ip"] = ip
-                
-                # Track best "best" value for this domain
-                if best < domain_stats[hostname]["best_best"]:
-                    domain_stats[hostname]["best_best"] = best
-                    domain_stats[hostname]["best_best_ip"] = ip
-                
-                # Instance passes if ANY IP meets criteria
-                if ip_passed:
-                    instance_passed = True
+            # Instance passes if ANY IP meets criteria, i.e. if the domain's
+            # best median or best "best" does
+            if best_median <= self.median_threshold or best_best <= self.best_threshold:
+                instance_passed = True
         
         return domain_stats, instance_passed
     
@@ -79,16 +74,11 @@ class ResultProcessor:
         Returns:
             Formatted summary string
         """
-        lines = []
-        
         # Show per-domain best results
-        for hostname, stats in domain_stats.items():
-            domain_short = format_domain_short(hostname)
-            lines.append(
-                f"  {domain_short}: median={stats['best_median']:.2f}µs "
-                f"({stats['best_median_ip']}), best={stats['best_best']:.2f}µs "
-                f"({stats['best_best_ip']})"
-            )
+        lines = [
+            f"  {format_domain_stats(hostname, stats)}"
+            for hostname, stats in domain_stats.items()
+        ]
         
         lines.append(f"  Passed: {instance_passed}")
         
@@ -109,19 +99,19 @@ class ResultProcessor:
         Returns:
             Formatted report string
         """
+        # Format each domain once; the report lists them twice
+        domain_lines = [
+            format_domain_stats(hostname, stats)
+            for hostname, stats in domain_stats.items()
+        ]
+        
         lines = [
             f"*** Found qualified instance {instance_id} (type {instance_type}) "
             f"meeting latency criteria! ***"
         ]
         
         # Show per-domain results
-        for hostname, stats in domain_stats.items():
-            domain_short = format_domain_short(hostname)
-            lines.append(
-                f"{domain_short}: median={stats['best_median']:.2f}µs "
-                f"({stats['best_median_ip']}), best={stats['best_best']:.2f}µs "
-                f"({stats['best_best_ip']})"
-            )
+        lines.extend(domain_lines)
         
         # Write success report
         lines.extend([
@@ -132,13 +122,7 @@ class ResultProcessor:
             f"- Per-domain results:"
         ])
         
-        for hostname, stats in domain_stats.items():
-            domain_short = format_domain_short(hostname)
-            lines.append(
-                f"  - {domain_short}: median={stats['best_median']:.2f}µs "
-                f"({stats['best_median_ip']}), best={stats['best_best']:.2f}µs "
-                f"({stats['best_best_ip']})"
-            )
+        lines.extend(f"  - {line}" for line in domain_lines)
         
         lines.append(f"\n[INFO] Search will continue to find more qualified instances...")
         
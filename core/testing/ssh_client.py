@@ -1,10 +1,42 @@
 """SSH client operations for the latency finder."""
 
+import atexit
+import os
+import shlex
+import shutil
 import subprocess
 import sys
+import tempfile
+import threading
 import time
-from typing import Tuple
-from ..constants import DEFAULT_SSH_TIMEOUT, DEFAULT_SSH_MAX_ATTEMPTS, DEFAULT_SSH_RETRY_DELAY
+from typing import Optional, Tuple
+from ..constants import (
+    DEFAULT_SSH_TIMEOUT, DEFAULT_SSH_MAX_ATTEMPTS, DEFAULT_SSH_RETRY_DELAY,
+    SSH_RETRY_MAX_DELAY, SSH_CONNECT_TIMEOUT, SSH_EARLY_CONNECT_TIMEOUT, SSH_EARLY_ATTEMPTS,
+    SSH_CONTROL_PERSIST
+)
+
+_control_dir: Optional[str] = None
+_control_dir_lock = threading.Lock()
+
+
+def _get_control_dir() -> str:
+    """Get the private directory holding ControlMaster sockets.
+    
+    Created once per process with mkdtemp (mode 0700), so other local users
+    cannot plant or reach sockets the way they could in the shared temp
+    directory, and shared by every SSHClient so they all reuse the same
+    masters. Removed again at exit.
+    
+    Returns:
+        Directory path
+    """
+    global _control_dir
+    with _control_dir_lock:
+        if _control_dir is None:
+            _control_dir = tempfile.mkdtemp(prefix="latency-finder-ssh-")
+            atexit.register(shutil.rmtree, _control_dir, ignore_errors=True)
+        return _control_dir
 
 
 class SSHClient:
@@ -17,43 +49,122 @@ class SSHClient:
             key_path: Path to SSH private key
         """
         self.key_path = key_path
+        # Sockets for multiplexed (ControlMaster) connections; %C is a hash of
+        # the local host, remote host, port and user
+        self.control_path = os.path.join(_get_control_dir(), "%C")
     
-    def _build_ssh_base_cmd(self, ip: str) -> list:
-        """Build base SSH command with standard options.
+    def _build_ssh_options(self, connect_timeout: int = SSH_CONNECT_TIMEOUT) -> list:
+        """Build the option arguments shared by ssh, scp and rsync's remote shell.
+        
+        Calls never become a master themselves (ControlMaster=no), but reuse
+        the one open_master started for the host, if any, instead of a fresh
+        TCP and SSH handshake; without a master they connect directly.
         
         Args:
-            ip: Target IP address
+            connect_timeout: ssh ConnectTimeout in seconds
             
         Returns:
-            List of SSH command components
+            List of option components (without program name or target)
         """
         return [
-            "ssh",
             "-i", self.key_path,
             "-o", "StrictHostKeyChecking=no",
             "-o", "UserKnownHostsFile=/dev/null",
-            "-o", "ConnectTimeout=10",
+            "-o", f"ConnectTimeout={connect_timeout}",
             "-o", "LogLevel=ERROR",
-            f"ec2-user@{ip}"
+            "-o", "ControlMaster=no",
+            "-o", f"ControlPath={self.control_path}"
         ]
     
+    def _build_ssh_base_cmd(self, ip: str, connect_timeout: int = SSH_CONNECT_TIMEOUT) -> list:
+        """Build base SSH command with standard options.
+        
+        Args:
+            ip: Target IP address
+            connect_timeout: ssh ConnectTimeout in seconds
+            
+        Returns:
+            List of SSH command components
+        """
+        return ["ssh"] + self._build_ssh_options(connect_timeout) + [f"ec2-user@{ip}"]
+    
     def _build_scp_base_cmd(self) -> list:
         """Build base SCP command with standard options.
         
         Returns:
             List of SCP command components (without source/destination)
         """
-        return [
-            "scp",
-            "-i", self.key_path,
-            "-o", "StrictHostKeyChecking=no",
-            "-o", "UserKnownHostsFile=/dev/null",
-            "-o", "ConnectTimeout=10",
-            "-o", "LogLevel=ERROR"
-        ]
+        return ["scp"] + self._build_ssh_options()
+    
+    def _build_rsync_base_cmd(self, timeout: int) -> list:
+        """Build base rsync command tunnelled over SSH with standard options.
+        
+        Args:
+            timeout: I/O timeout in seconds passed to rsync
+            
+        Returns:
+            List of rsync command components (without source/destination)
+        """
+        remote_shell = shlex.join(["ssh"] + self._build_ssh_options())
+        return ["rsync", "-az", f"--timeout={timeout}", "-e", remote_shell]
+    
+    def open_master(self, ip: str) -> bool:
+        """Start a multiplexed master connection to a host in the background.
+        
+        Started explicitly with -N -f and all stdio on DEVNULL: a master
+        forked implicitly by a ControlMaster=auto call can keep that call's
+        captured stdout/stderr pipes open on some OpenSSH versions, so
+        subprocess.run would not return until ControlPersist expires. The
+        master exits after SSH_CONTROL_PERSIST idle time or via close_master.
+        
+        Args:
+            ip: Target IP address
+            
+        Returns:
+            True if the master is running
+        """
+        # ssh keeps the first value given for an option, so these override
+        # ControlMaster=no from the shared options
+        master_cmd = (
+            ["ssh", "-N", "-f",
+             "-o", "ControlMaster=yes",
+             "-o", f"ControlPersist={SSH_CONTROL_PERSIST}"]
+            + self._build_ssh_options()
+            + [f"ec2-user@{ip}"]
+        )
+        try:
+            result = subprocess.run(
+                master_cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=SSH_CONNECT_TIMEOUT + 10
+            )
+            return result.returncode == 0
+        except (subprocess.TimeoutExpired, OSError):
+            return False
+    
+    def close_master(self, ip: str) -> None:
+        """Close the multiplexed master connection to a host, if one is open.
+        
+        Called once the orchestrator is done with an instance, so its
+        ControlMaster process and socket do not linger for the rest of
+        SSH_CONTROL_PERSIST after the instance is terminated.
+        
+        Args:
+            ip: Target IP address
+        """
+        exit_cmd = ["ssh", "-o", f"ControlPath={self.control_path}", "-O", "exit", f"ec2-user@{ip}"]
+        try:
+            # Fails harmlessly when no master is running for this host
+            subprocess.run(exit_cmd, capture_output=True, timeout=5)
+        except (subprocess.TimeoutExpired, OSError):
+            pass
     
     def run_command(self, ip: str, command: str, timeout: int = DEFAULT_SSH_TIMEOUT, 
-                   capture_stderr: bool = True) -> Tuple[str, str, int]:
+                   capture_stderr: bool = True,
+                   connect_timeout: int = SSH_CONNECT_TIMEOUT,
+                   input_data: Optional[str] = None) -> Tuple[str, str, int]:
         """Run command via SSH and return output.
         
         Args:
@@ -61,15 +172,18 @@ class SSHClient:
             command: Command to execute
             timeout: Command timeout in seconds
             capture_stderr: Whether to capture stderr separately
+            connect_timeout: ssh ConnectTimeout in seconds
+            input_data: Optional text fed to the remote command's stdin
             
         Returns:
             Tuple of (stdout, stderr, return_code)
         """
-        ssh_cmd = self._build_ssh_base_cmd(ip) + [command]
+        ssh_cmd = self._build_ssh_base_cmd(ip, connect_timeout) + [command]
         
         try:
             result = subprocess.run(
                 ssh_cmd, 
+                input=input_data,
                 capture_output=True, 
                 text=True, 
                 timeout=timeout
@@ -207,23 +321,34 @@ class SSHClient:
     
     def wait_for_ssh(self, ip: str, max_attempts: int = DEFAULT_SSH_MAX_ATTEMPTS) -> bool:
         """Wait for SSH to be available.
-        
+
+        Attempts back off exponentially from DEFAULT_SSH_RETRY_DELAY up to
+        SSH_RETRY_MAX_DELAY, and the first SSH_EARLY_ATTEMPTS probes (which
+        usually hit an instance that is still booting) use a short ConnectTimeout.
+
         Args:
             ip: Target IP address
             max_attempts: Maximum connection attempts
-            
+
         Returns:
             True if SSH is ready, False on timeout
         """
         print(f"Waiting for SSH access to {ip}...")
-        
+
+        delay = DEFAULT_SSH_RETRY_DELAY
         for i in range(max_attempts):
-            stdout, stderr, code = self.run_command(ip, "echo ready", timeout=10)
-            if code == 0 and "ready" in stdout:
+            connect_timeout = SSH_EARLY_CONNECT_TIMEOUT if i < SSH_EARLY_ATTEMPTS else SSH_CONNECT_TIMEOUT
+            stdout, stderr, code = self.run_command(ip, "echo ready", timeout=10,
+                                                    connect_timeout=connect_timeout)
+            if stdout.startswith("ready"):
                 print("[OK] SSH is ready!")
+                # Later commands, copies and the test reuse this connection
+                if not self.open_master(ip):
+                    print("[WARN] Could not open a shared SSH connection; using one per command")
                 return True
             print(f"  Attempt {i+1}/{max_attempts}...")
-            time.sleep(DEFAULT_SSH_RETRY_DELAY)
+            time.sleep(delay)
+            delay = min(delay * 2, SSH_RETRY_MAX_DELAY)
         
         return False
     
@@ -258,15 +383,11 @@ class SSHClient:
         while time.time() - start_time < wait_time:
             elapsed = int(time.time() - start_time)
             
-            # Check CPU load
-            stdout, stderr, code = self.run_command(
-                ip, 
-                "uptime | awk '{print $(NF-2)}' | sed 's/,//'", 
-                timeout=5
-            )
+            # Check CPU load (first field of /proc/loadavg is the 1-minute average)
+            stdout, stderr, code = self.run_command(ip, "cat /proc/loadavg", timeout=5)
             if code == 0 and stdout.strip():
                 try:
-                    load = float(stdout.strip())
+                    load = float(stdout.split()[0])
                     print(f"  [{elapsed}s] CPU load: {load:.2f}")
                 except ValueError:
                     pass
@@ -308,21 +429,41 @@ class SSHClient:
         return True
     
     def copy_file(self, ip: str, local_file_path: str, remote_file_path: str, timeout: int = 30) -> bool:
-        """Copy file to remote instance using SCP.
+        """Copy file to remote instance.
+        
+        Uses rsync (compressed, skips unchanged content) when it is installed
+        locally, and falls back to SCP if rsync is missing or fails, e.g. when
+        the remote image does not ship rsync.
         
         Args:
             ip: Target IP address
             local_file_path: Path to local file
             remote_file_path: Remote destination path
-            timeout: SCP timeout in seconds
+            timeout: Transfer timeout in seconds
             
         Returns:
             True if successful, False otherwise
         """
-        scp_cmd = self._build_scp_base_cmd() + [
-            local_file_path,
-            f"ec2-user@{ip}:{remote_file_path}"
-        ]
+        destination = f"ec2-user@{ip}:{remote_file_path}"
+        
+        if shutil.which("rsync"):
+            rsync_cmd = self._build_rsync_base_cmd(timeout) + [local_file_path, destination]
+            try:
+                result = subprocess.run(
+                    rsync_cmd,
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout
+                )
+                if result.returncode == 0:
+                    return True
+                print(f"[WARN] rsync failed, falling back to SCP: {result.stderr.strip()}")
+            except subprocess.TimeoutExpired:
+                print(f"[WARN] rsync timed out after {timeout}s, falling back to SCP")
+            except Exception as e:
+                print(f"[WARN] rsync error, falling back to SCP: {str(e)}")
+        
+        scp_cmd = self._build_scp_base_cmd() + [local_file_path, destination]
         
         try:
             result = subprocess.run(
@@ -359,11 +500,10 @@ class SSHClient:
         Returns:
             True if successful, False otherwise
         """
-        # Escape single quotes in script content
-        escaped_content = script_content.replace("'", "'\"'\"'")
-        create_script_cmd = f"echo '{escaped_content}' > {script_path}"
+        # Stream the content over stdin: no quote escaping or argv size limit
+        create_script_cmd = f"cat > {shlex.quote(script_path)}"
         
-        stdout, stderr, code = self.run_command(ip, create_script_cmd)
+        stdout, stderr, code = self.run_command(ip, create_script_cmd, input_data=script_content)
         if code != 0:
             print(f"[ERROR] Failed to create script: {stderr}")
             return False
@@ -1,10 +1,15 @@
 """Shared utilities for the latency finder."""
 
 import os
+import re
 import datetime
-from typing import Tuple
+from functools import lru_cache
+from typing import Any, Dict, Tuple
 from .constants import UTC_PLUS_8, LOG_DATE_FORMAT
 
+# Binance domain suffixes stripped for display (e.g. fapi-mm.binance.com -> fapi-mm)
+_DOMAIN_SUFFIX_RE = re.compile(r"\.binance\.(?:com|us|me)$")
+
 
 def get_current_timestamp() -> str:
     """Get current timestamp in UTC+8 timezone."""
@@ -29,11 +34,13 @@ def get_log_file_paths(report_dir: str, median_threshold: int, best_threshold: i
     Returns:
         Tuple of (summary_jsonl_file, text_file, detailed_jsonl_file)
     """
-    base_name = f"latency_{median_threshold}-{best_threshold}_{run_timestamp}"
+    # Join the directory once; the file names only differ by f-string suffix
+    prefix = os.path.join(report_dir, "")
+    suffix = f"{median_threshold}-{best_threshold}_{run_timestamp}"
     
-    summary_jsonl_file = os.path.join(report_dir, f"{base_name}.jsonl")
-    text_file = os.path.join(report_dir, f"{base_name}.txt")
-    detailed_jsonl_file = os.path.join(report_dir, f"latency_detailed_{median_threshold}-{best_threshold}_{run_timestamp}.jsonl")
+    summary_jsonl_file = f"{prefix}latency_{suffix}.jsonl"
+    text_file = f"{prefix}latency_{suffix}.txt"
+    detailed_jsonl_file = f"{prefix}latency_detailed_{suffix}.jsonl"
     
     return summary_jsonl_file, text_file, detailed_jsonl_file
 
@@ -43,6 +50,28 @@ def ensure_directory_exists(directory: str) -> None:
     os.makedirs(directory, exist_ok=True)
 
 
+@lru_cache(maxsize=None)
 def format_domain_short(domain: str) -> str:
-    """Get short form of domain name."""
-    return domain.replace(".binance.com", "")
\ No newline at end of file
+    """Get short form of domain name.
+    
+    Cached: only the handful of configured domains are ever passed in, and
+    every report line for every instance formats them again.
+    """
+    return _DOMAIN_SUFFIX_RE.sub("", domain)
+
+
+def format_domain_stats(hostname: str, stats: Dict[str, Any]) -> str:
+    """Format one domain's best results as a report line (without indent).
+    
+    Args:
+        hostname: Domain name
+        stats: Domain statistics from ResultProcessor.process_results
+        
+    Returns:
+        Line like "fapi-mm: median=...µs (ip), best=...µs (ip)"
+    """
+    return (
+        f"{format_domain_short(hostname)}: median={stats['best_median']:.2f}µs "
+        f"({stats['best_median_ip']}), best={stats['best_best']:.2f}µs "
+        f"({stats['best_best_ip']})"
+    )
@@ -213,7 +213,7 @@ def run_local_monitoring(config: dict, raw_data_dir: str = None, machine_name: s
     # Create simplified IP list for monitoring (like test_instance_latency.py approach)
     simplified_ip_list = _create_simplified_ip_list_for_monitoring(ip_list_file, config['monitoring_domains'])
     with open(os.path.join(monitor_dir, "ip_list_latest.json"), 'w') as f:
-        json.dump(simplified_ip_list, f, indent=2)
+        json.dump(simplified_ip_list, f, separators=(",", ":"))
     
     # Get monitoring script path
     monitor_script = os.path.join(
@@ -17,10 +17,13 @@ Usage:
 import sys
 import os
 import json
+import datetime
 import subprocess
 import boto3
 from core.testing import SSHClient, LocalCommandRunner
 from core.testing.file_deployment import create_ip_list_deployer
+from core.testing.latency_runner import parse_results
+from core.constants import UTC_PLUS_8
 
 def get_instance_public_ip(instance_id, region):
     """Get the public IP of an instance."""
@@ -215,7 +218,7 @@ def main():
     if full_stdout:
         try:
             print("\nProcessing results...")
-            results = json.loads(full_stdout)
+            results = parse_results(full_stdout)
             print("\n" + "="*60)
             print("RESULTS:")
             print("="*60)
@@ -240,8 +243,7 @@ def main():
                 display_id = instance_id
             
             # Format timestamp
-            import datetime
-            timestamp = datetime.datetime.now(datetime.timezone(datetime.timedelta(hours=8))).strftime('%Y-%m-%d %H:%M:%S%z')
+            timestamp = datetime.datetime.now(UTC_PLUS_8).strftime('%Y-%m-%d %H:%M:%S%z')
             
             print(f"\n[{timestamp}] {display_id}  {instance_type:<9}")
             
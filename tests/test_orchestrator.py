@@ -0,0 +1,44 @@
+"""Tests for Orchestrator worker error handling."""
+
+import threading
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("boto3")
+
+from core import orchestrator as orchestrator_module
+from core.orchestrator import Orchestrator
+
+
+def _make_orchestrator() -> Orchestrator:
+    """Build an Orchestrator with mocked AWS/SSH components, skipping __init__."""
+    orch = Orchestrator.__new__(Orchestrator)
+    orch.config = mock.Mock(use_eip=False)
+    orch.running = True
+    orch.qualified_instances = []
+    orch._in_flight = {}
+    orch._state_lock = threading.Lock()
+    orch.ec2_manager = mock.Mock()
+    orch.pg_manager = mock.Mock()
+    orch.eip_manager = mock.Mock()
+    orch.ssh_client = mock.Mock()
+    return orch
+
+
+def test_failed_worker_iteration_cleans_up_tracked_resources(monkeypatch):
+    orch = _make_orchestrator()
+    monkeypatch.setattr(orchestrator_module.time, "sleep", lambda _: None)
+
+    def failing_iteration():
+        orch._track(placement_group="pg-1", instance_id="i-123")
+        raise RuntimeError("Could not connect to the endpoint URL")
+
+    monkeypatch.setattr(orch, "_run_iteration", failing_iteration)
+
+    orch._run_worker_iteration()
+
+    orch.ec2_manager.queue_termination.assert_called_once_with("i-123")
+    orch.ec2_manager.flush_terminations.assert_called_once()
+    orch.pg_manager.schedule_async_cleanup.assert_called_once_with("i-123", "pg-1")
+    assert orch._in_flight == {}
@@ -0,0 +1,41 @@
+"""Tests for the shared termination watcher."""
+
+import threading
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("boto3")
+
+from core.aws import termination_watcher as watcher_module
+
+
+def _make_watcher(terminated_ids):
+    """Build a watcher whose DescribeInstances reports the given IDs terminated."""
+    client = mock.Mock()
+
+    def paginate(Filters):
+        ids = [i for i in Filters[0]["Values"] if i in terminated_ids]
+        return [{"Reservations": [{"Instances": [{"InstanceId": i} for i in ids]}]}]
+
+    client.get_paginator.return_value.paginate.side_effect = paginate
+    with mock.patch.object(watcher_module, "create_ec2_client", return_value=client):
+        return watcher_module.TerminationWatcher("ap-northeast-1")
+
+
+def test_new_instance_interrupts_backoff(monkeypatch):
+    # A long first interval: without the wake-up the new instance would only
+    # be polled after it
+    monkeypatch.setattr(watcher_module, "CLEANUP_CHECK_DELAY", 30)
+    watcher = _make_watcher({"i-done"})
+
+    slow_waiter = threading.Thread(
+        target=watcher.wait_for_termination, args=("i-slow", 3), daemon=True
+    )
+    slow_waiter.start()
+    # Let the poller run its first describe and enter the long wait
+    while watcher.client.get_paginator.return_value.paginate.call_count == 0:
+        threading.Event().wait(0.01)
+
+    assert watcher.wait_for_termination("i-done", timeout=2)
+    slow_waiter.join()